@@ -0,0 +1,399 @@
+#!/usr/bin/env python3
+import argparse
+import concurrent.futures
+import importlib
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from collections import namedtuple
+from datetime import datetime, timezone
+from math import prod
+from pathlib import Path
+
+import rendering
+from generators import GENERATORS
+from profiling import Profiler
+from puzzle_input import get_data
+
+# --- Benchmark runner for all days ---
+
+SRC = Path(__file__).parent
+
+Solver = namedtuple("Solver", ["solve", "answer"])
+Task = namedtuple("Task", ["day", "part", "label", "inputs", "answer"])
+
+# Every day maps part numbers to a function of (module, raw puzzle input) and the known answer for that input
+SOLVERS = {
+    1: {1: Solver(lambda m, s: m.count_changes(m.process_inputs(s)), 1387),
+        2: Solver(lambda m, s: m.count_changes(m.process_inputs(s), 3), 1362)},
+    2: {1: Solver(lambda m, s: prod(m.follow_incorrect(m.process_inputs(s))), 1692075),
+        2: Solver(lambda m, s: prod(m.follow(m.process_inputs(s))), 1749524700)},
+    3: {1: Solver(lambda m, s: prod(int(x, 2) for x in m.max_min(m.binary_tally(m.process_inputs(s)))), 3985686),
+        2: Solver(lambda m, s: prod(m.life_support_ratings(m.process_inputs(s))), 2555739)},
+    4: {1: Solver(lambda m, s: m.get_score_for_best_board(s), 25023),
+        2: Solver(lambda m, s: m.get_score_for_worst_board(s), 2634)},
+    5: {1: Solver(lambda m, s: m.count_overlaps(s), 7414),
+        2: Solver(lambda m, s: m.count_overlaps(s, True), 19676)},
+    6: {1: Solver(lambda m, s: m.count_after_days(s, 80), 350149),
+        2: Solver(lambda m, s: m.count_after_days(s, 256), 1590327954513)},
+    7: {1: Solver(lambda m, s: m.solve([int(x) for x in s.split(',')]), None),
+        2: Solver(lambda m, s: m.solve2([int(x) for x in s.split(',')]), None)},
+    8: {1: Solver(lambda m, s: m.count_easy_digits(s), 301),
+        2: Solver(lambda m, s: m.count_outputs(s), 908067)},
+    9: {1: Solver(lambda m, s: m.solve1(s), 530),
+        2: Solver(lambda m, s: m.solve2(s), 1019494)},
+    10: {1: Solver(lambda m, s: m.solve1(s), 399153),
+         2: Solver(lambda m, s: m.solve2(s), 2995077699)},
+    11: {1: Solver(lambda m, s: m.solve(s)[0], 1661),
+         2: Solver(lambda m, s: m.solve(s)[1], 334)},
+    12: {1: Solver(lambda m, s: len(m.get_paths(s)), 3298),
+         2: Solver(lambda m, s: len(m.get_paths(s, True)), 93572)},
+    13: {1: Solver(lambda m, s: m.solve(s)[0], 818),
+         2: Solver(lambda m, s: m.solve(s)[1], "LRGPRECB")},
+    14: {1: Solver(lambda m, s: m.solve(s, 10), 3284),
+         2: Solver(lambda m, s: m.solve(s, 40), 4302675529689)},
+    15: {1: Solver(lambda m, s: m.solve(s), 720),
+         2: Solver(lambda m, s: m.solve(s, 5), 3025)},
+    16: {1: Solver(lambda m, s: m.get_version_sum(s), 951),
+         2: Solver(lambda m, s: m.solve(s), 902198718880)},
+    17: {1: Solver(lambda m, s: m.solve(s)[0], 5460),
+         2: Solver(lambda m, s: m.solve(s)[1], 3618)},
+    18: {1: Solver(lambda m, s: m.mag_finalsum(s)[0], 2907),
+         2: Solver(lambda m, s: m.find_largest_mag(s), 4690)},
+    19: {1: Solver(lambda m, s: m.solve(s), None)},
+    20: {1: Solver(lambda m, s: m.enhance(s, 2), 5573),
+         2: Solver(lambda m, s: m.enhance(s, 50), 20097)},
+    21: {1: Solver(lambda m, s: m.solve(s, m.OneHunderdSidedDie(0)), 675024)},
+}
+
+# The example inputs of every day with the answers asserted in its main()
+EXAMPLES = {
+    4: lambda m: [(1, m.example, 4512), (2, m.example, 1924)],
+    5: lambda m: [(1, m.example, 5), (2, m.example, 12)],
+    6: lambda m: [(1, m.example, 5934), (2, m.example, 26984457539)],
+    7: lambda m: [(1, m.example, 37), (2, m.example, 168)],
+    8: lambda m: [(1, m.example, 26), (2, m.example2, 5353), (2, m.example, 61229)],
+    9: lambda m: [(1, m.example, 15), (2, m.example, 1134)],
+    10: lambda m: [(1, m.example, 26397), (2, m.example, 288957)],
+    11: lambda m: [(1, m.example, 1656), (2, m.example, 195)],
+    12: lambda m: [(1, m.example1, 10), (1, m.example2, 19), (1, m.example3, 226),
+                   (2, m.example1, 36), (2, m.example2, 103), (2, m.example3, 3509)],
+    13: lambda m: [(1, m.example, 17), (2, m.example, "O")],
+    14: lambda m: [(1, m.example, 1588), (2, m.example, 2188189693529)],
+    15: lambda m: [(1, m.example, 40), (2, m.example, 315)],
+    16: lambda m: [(1, x, answer) for x, answer in m.examples1] + [(2, x, answer) for x, answer in m.examples2],
+    17: lambda m: [(1, m.example, 45), (2, m.example, 112)],
+    18: lambda m: [(1, m.example, 4140), (2, m.example, 3993)],
+    19: lambda m: [(1, m.example, None)],  # day 19 is unfinished, it finds 87 beacons instead of 79
+    20: lambda m: [(1, m.example, 35), (2, m.example, 3351)],
+    21: lambda m: [(1, m.example, 739785)],
+}
+
+
+def main():
+    args = parse_args()
+    rendering.set_enabled(args.render)
+    days = args.days or discover_days()
+    if args.size:
+        tasks = synthetic_tasks(days, args.size, args.seed)
+    else:
+        tasks = collect_tasks(days, args.fetch, args.examples)
+    start = time.perf_counter()
+    if args.jobs is None:
+        results = [run_task(task, args) for task in tasks]
+    else:
+        args.jobs = args.jobs or os.cpu_count()
+        expected = read_expected_durations(args.expected) if args.expected else {}
+        results = run_parallel(tasks, args, expected)
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "repeat": args.repeat,
+        "warmup": args.warmup,
+        "jobs": args.jobs,
+        "wall_time": time.perf_counter() - start,
+        "results": results
+    }
+    if args.compare:
+        report["regressions"] = find_regressions(results, read_baseline(args.baseline),
+                                                 args.threshold, args.memory_threshold, args.noise)
+    failures = [r for r in results if r["correct"] is False] + report.get("regressions", [])
+    if args.save_baseline:
+        failed = {result_key(f) for f in failures}
+        save_baseline(args.baseline, [r for r in results if result_key(r) not in failed])
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+    else:
+        print(output)
+    for failure in failures:
+        print(describe_failure(failure), file=sys.stderr)
+    if failures:
+        sys.exit(1)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the Advent of Code 2021 solvers.")
+    parser.add_argument("days", nargs="*", type=int, help="days to run (default: all)")
+    parser.add_argument("-n", "--repeat", type=int, default=5, help="timed runs per part")
+    parser.add_argument("-w", "--warmup", type=int, default=1, help="untimed runs before timing")
+    parser.add_argument("-o", "--output", help="write the JSON report to this file instead of stdout")
+    parser.add_argument("-j", "--jobs", type=int, nargs="?", const=0,
+                        help="run all parts in a process pool of this size (default: one per CPU)")
+    parser.add_argument("--expected", metavar="REPORT",
+                        help="earlier JSON report whose medians decide the order of the process pool, slowest first")
+    parser.add_argument("--examples", action="store_true", help="also run the example assertions from each main()")
+    parser.add_argument("--size", type=int, nargs="+",
+                        help="run on synthetic inputs of these sizes instead of the puzzle inputs")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the synthetic inputs")
+    parser.add_argument("--fetch", action="store_true", default=None,
+                        help="download inputs missing from the cache with aocd")
+    parser.add_argument("--render", action="store_true", help="keep the solvers' terminal visualisations on")
+    parser.add_argument("--baseline", default=str(SRC / "baseline.json"),
+                        help="baseline file to save to and compare with (default: baseline.json next to bench.py)")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="record the results in the baseline, replacing earlier results of the same parts; "
+                             "parts with a wrong answer or a regression are left out")
+    parser.add_argument("--compare", action="store_true",
+                        help="exit with an error when a part got slower or needs more memory than in the baseline")
+    parser.add_argument("--threshold", type=float, default=0.1,
+                        help="allowed relative increase of the fastest time (default: 0.1)")
+    parser.add_argument("--noise", type=float, default=0.005,
+                        help="time increases up to this many seconds are never a regression (default: 0.005)")
+    parser.add_argument("--memory-threshold", type=float, default=0.1,
+                        help="allowed relative increase of the peak memory (default: 0.1)")
+    parser.add_argument("--memory", type=int, nargs="?", const=10, default=0, metavar="TOP",
+                        help="also report the TOP lines that hold the most memory at the peak of each part (default: 10)")
+    parser.add_argument("--profile", nargs="+", default=[], metavar="FUNCTION",
+                        help="profile these functions, e.g. day18.sf_explode, in one extra run per part")
+    parser.add_argument("--profile-dir", default="profiles",
+                        help="directory for the flat profiles and collapsed stacks (default: profiles)")
+    args = parser.parse_args()
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+    return args
+
+
+def discover_days() -> list[int]:
+    days = sorted(int(p.stem[3:]) for p in SRC.glob("day[0-9][0-9].py"))
+    return [d for d in days if d in SOLVERS]
+
+
+def collect_tasks(days: list[int], fetch: bool = None, examples: bool = False) -> list[Task]:
+    tasks = []
+    for day in days:
+        if examples and day in EXAMPLES:
+            module = importlib.import_module(f"day{day:02}")
+            for i, (part, inputs, answer) in enumerate(EXAMPLES[day](module), 1):
+                tasks.append(Task(day, part, f"example {i}", inputs, answer))
+        try:
+            inputs = get_data(day, fetch)
+        except FileNotFoundError as e:
+            print(f"skipping day {day}: {e}", file=sys.stderr)
+            continue
+        tasks.extend(Task(day, part, "input", inputs, solver.answer) for part, solver in SOLVERS[day].items())
+    return tasks
+
+
+def synthetic_tasks(days: list[int], sizes: list[int], seed: int = 0) -> list[Task]:
+    return [Task(day, part, f"synthetic {size}", GENERATORS[day](size, seed), None)
+            for day in days
+            for size in sizes
+            for part in SOLVERS[day]]
+
+
+def run_parallel(tasks: list[Task], options: argparse.Namespace, expected: dict[tuple, float]) -> list[dict]:
+    """
+    Run the tasks in a process pool, submitting the ones expected to take longest first so the pool finishes in
+    roughly the time of the slowest task. Tasks without an expected duration are treated as slow.
+    """
+    ordered = sorted(tasks, key=lambda t: expected.get((t.day, t.part, t.label), float('inf')), reverse=True)
+    with concurrent.futures.ProcessPoolExecutor(options.jobs, initializer=rendering.set_enabled,
+                                                initargs=(options.render,)) as pool:
+        futures = {task: pool.submit(run_task, task, options) for task in ordered}
+        return [futures[task].result() for task in tasks]
+
+
+def read_expected_durations(report: str) -> dict[tuple, float]:
+    results = json.loads(Path(report).read_text())["results"]
+    return {result_key(r): r["median"] for r in results if "median" in r}
+
+
+def result_key(result: dict) -> tuple:
+    return result["day"], result["part"], result.get("input", "input")
+
+
+def read_baseline(path: str) -> dict[tuple, dict]:
+    if not Path(path).exists():
+        return {}
+    return {result_key(r): r for r in json.loads(Path(path).read_text())["results"]}
+
+
+def save_baseline(path: str, results: list[dict]):
+    baseline = read_baseline(path)
+    baseline.update((result_key(r), r) for r in results)
+    ordered = sorted(baseline.values(), key=lambda r: (r["day"], r["part"], r.get("input", "input")))
+    Path(path).write_text(json.dumps({"results": ordered}, indent=2) + "\n")
+
+
+def find_regressions(results: list[dict], baseline: dict[tuple, dict],
+                     threshold: float, memory_threshold: float, noise: float = 0.005) -> list[dict]:
+    """
+    Compare the results with the baseline. Times are compared by the fastest run, which is far less affected by
+    whatever else the machine is doing than the median, and increases below the noise level are ignored, since
+    sub-millisecond timings easily vary by more than any sensible relative threshold.
+    :param results: The new results
+    :param baseline: Earlier results per (day, part, input)
+    :param threshold: How much slower, relatively, the fastest run may become
+    :param memory_threshold: How much larger, relatively, the peak memory may become
+    :param noise: How many seconds slower a part may always become
+    :return: A description of every part that got slower or uses more memory than allowed
+
+    >>> old = {(1, 1, "input"): {"min": 1.0, "peak_memory": 1000}}
+    >>> find_regressions([{"day": 1, "part": 1, "input": "input", "min": 1.05, "peak_memory": 2000}], old, 0.1, 0.5)
+    [{'day': 1, 'part': 1, 'input': 'input', 'metric': 'peak_memory', 'baseline': 1000, 'current': 2000}]
+    >>> old = {(1, 1, "input"): {"min": 0.0005, "peak_memory": 1000}}
+    >>> find_regressions([{"day": 1, "part": 1, "input": "input", "min": 0.0009, "peak_memory": 1000}], old, 0.1, 0.1)
+    []
+    """
+    regressions = []
+    for result in results:
+        old = baseline.get(result_key(result))
+        if not old or "error" in result:
+            continue
+        for metric, allowed, floor in (("min", threshold, noise), ("peak_memory", memory_threshold, 0)):
+            if result[metric] > old[metric] * (1 + allowed) and result[metric] - old[metric] > floor:
+                regressions.append({"day": result["day"], "part": result["part"], "input": result["input"],
+                                    "metric": metric, "baseline": old[metric], "current": result[metric]})
+    return regressions
+
+
+def describe_failure(failure: dict) -> str:
+    name = f"day {failure['day']} part {failure['part']} ({failure['input']})"
+    if "metric" in failure:
+        return f"{name}: {failure['metric']} regressed from {failure['baseline']} to {failure['current']}"
+    if "error" in failure:
+        return f"{name}: failed with {failure['error']}"
+    return f"{name}: wrong answer {failure['answer']}"
+
+
+def run_task(task: Task, options: argparse.Namespace) -> dict:
+    """
+    Time the task, and record it as failed if the solver raises, so one broken part doesn't end the whole run.
+    """
+    try:
+        return measure_task(task, options)
+    except Exception as e:
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        return {"day": task.day, "part": task.part, "input": task.label, "answer": None, "correct": False,
+                "error": f"{type(e).__name__}: {e}"}
+
+
+def measure_task(task: Task, options: argparse.Namespace) -> dict:
+    module = importlib.import_module(f"day{task.day:02}")
+    solve = SOLVERS[task.day][task.part].solve
+    for _ in range(options.warmup):
+        solve(module, task.inputs)
+    timings = []
+    for _ in range(options.repeat):
+        start = time.perf_counter()
+        answer = solve(module, task.inputs)
+        timings.append(time.perf_counter() - start)
+    tracemalloc.start()
+    solve(module, task.inputs)
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    result = {
+        "day": task.day,
+        "part": task.part,
+        "input": task.label,
+        "answer": answer if type(answer) in (int, str) else str(answer),
+        "correct": None if task.answer is None else answer == task.answer,
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "p95": percentile(timings, 95),
+        "peak_memory": peak_memory
+    }
+    if options.memory:
+        result["allocations"] = allocation_sites(task, module, options.memory)
+    targets = [t for t in options.profile if t.startswith(module.__name__ + ".")]
+    if targets:
+        result["profile"] = profile_task(task, module, targets, options.profile_dir)
+    return result
+
+
+def profile_task(task: Task, module, targets: list[str], profile_dir: str) -> list[dict]:
+    """
+    Run the task once more with the given functions profiled, and write a flat profile and a flamegraph-compatible
+    collapsed stack file for it to the profile directory.
+    """
+    solve = SOLVERS[task.day][task.part].solve
+    with Profiler(targets) as profiler:
+        solve(module, task.inputs)
+    path = Path(profile_dir)
+    path.mkdir(parents=True, exist_ok=True)
+    name = f"day{task.day:02}-part{task.part}-{task.label.replace(' ', '-')}"
+    (path / f"{name}.txt").write_text(profiler.report() + "\n")
+    (path / f"{name}.folded").write_text(profiler.collapsed_stacks() + "\n")
+    return profiler.flat_profile()
+
+
+def allocation_sites(task: Task, module, top: int) -> list[dict]:
+    """
+    Run the task once more under tracemalloc and find out which lines allocated the memory that is alive when the
+    traced memory reaches its peak. Snapshots are only taken on function calls and returns that pass the highest peak
+    so far by more than 5%, so the sites are those of (nearly) the real peak.
+    :param task: The task to measure
+    :param module: The solver module of the task
+    :param top: The number of sites to report
+    :return: File, line, size in bytes and number of blocks of the largest allocation sites
+    """
+    solve = SOLVERS[task.day][task.part].solve
+    peak = {"size": 0, "snapshot": None}
+
+    def on_event(_frame, event, _arg):
+        if event in ("call", "return"):
+            current, _ = tracemalloc.get_traced_memory()
+            if current > peak["size"] * 1.05:
+                peak["size"] = current
+                peak["snapshot"] = tracemalloc.take_snapshot()
+
+    tracemalloc.start()
+    sys.setprofile(on_event)
+    try:
+        solve(module, task.inputs)
+    finally:
+        sys.setprofile(None)
+        tracemalloc.stop()
+    if peak["snapshot"] is None:
+        return []
+    ignored = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)]
+    stats = peak["snapshot"].filter_traces(ignored).statistics("lineno")
+    return [{"file": Path(s.traceback[0].filename).name, "line": s.traceback[0].lineno, "size": s.size,
+             "count": s.count} for s in stats[:top]]
+
+
+def percentile(values: list[float], p: int) -> float:
+    """
+    Nearest-rank percentile of the given values.
+    :param values: The measurements
+    :param p: The percentile to take, between 0 and 100
+    :return: The smallest value that is at least as large as p percent of all values
+
+    >>> percentile([4, 1, 3, 2], 50)
+    2
+    >>> percentile([4, 1, 3, 2], 95)
+    4
+    """
+    ordered = sorted(values)
+    rank = max(1, -(-p * len(ordered) // 100))
+    return ordered[rank - 1]
+
+
+if __name__ == "__main__":
+    main()
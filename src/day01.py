@@ -1,25 +1,99 @@
 #!/usr/bin/env python3
+import os
+from collections import deque
+from collections.abc import Iterable, Iterator
 
 # --- Day 1: Sonar Sweep ---
 
 
 def read_numbers(filename):
     with open(filename) as f:
-        return [*map(int, f.readlines())]
+        return process_inputs(f.read())
 
 
-def count_changes(inputs, window_size=1):
+def process_inputs(inputs: str) -> list[int]:
+    return [*map(int, inputs.split())]
+
+
+def stream_depths(file, chunk_size: int = 1 << 20) -> Iterator[int]:
+    """
+    Read depth readings from a file in chunks, so a log of any size is parsed without being loaded as a whole.
+    :param file: The name of the file or a file opened in binary mode
+    :param chunk_size: The number of bytes to read at a time
+    :return: The readings, one by one
+    """
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, 'rb') as f:
+            yield from stream_depths(f, chunk_size)
+        return
+    rest = b''
+    while chunk := file.read(chunk_size):
+        numbers = (rest + chunk).split()
+        # the last number may continue in the next chunk
+        rest = b'' if chunk[-1:].isspace() else numbers.pop()
+        yield from map(int, numbers)
+    if rest:
+        yield int(rest)
+
+
+def count_increases(depths: Iterable[int], window_size: int = 1) -> int:
+    """
+    Count how often the sum of a sliding window increases, in one pass over the readings. Two neighbouring windows
+    share all but their first and last reading, so only the reading entering the window is compared to the one
+    leaving it, and only the last window_size readings are kept in a ring buffer.
+    :param depths: The readings, e.g. a list or stream_depths(file)
+    :param window_size: The number of readings per window
+    :return: The number of increases, 0 for windows without readings
+
+    >>> count_increases([199, 200, 208, 210, 200, 207, 240, 269, 260, 263], 3)
+    5
+    >>> import io
+    >>> count_increases(stream_depths(io.BytesIO(b"199\\n200\\n208\\n210\\n200\\n"), chunk_size=3))
+    3
+    >>> count_increases([1, 2, 3], 0)
+    0
+    """
+    if window_size < 1:
+        return 0
+    window = deque(maxlen=window_size)
     change_count = 0
-    for index, _ in enumerate(inputs):
-        if index + window_size >= len(inputs):
-            break
-        a = inputs[index:index + window_size]
-        b = inputs[index + 1:index + window_size + 1]
-        if sum(b) > sum(a):
-            change_count += 1
+    for depth in depths:
+        if len(window) == window_size:
+            change_count += depth > window[0]
+        window.append(depth)
     return change_count
 
 
+def read_depth_array(filename):
+    """
+    Parse all readings of a file at once with NumPy, which is much faster than int() per reading for large logs.
+    :param filename: The name of the file
+    :return: The readings as an array of 64-bit integers
+    """
+    import numpy as np
+    return np.loadtxt(filename, dtype=np.int64, ndmin=1)
+
+
+def count_increases_batch(depths, window_sizes: list[int]) -> list[int]:
+    """
+    Count the window increases for several window sizes at once, comparing the whole array with a shifted copy of
+    itself per window size instead of looping over the readings.
+    :param depths: The readings, as a NumPy array or any sequence of numbers
+    :param window_sizes: The window sizes to count increases for
+    :return: The number of increases per window size, 0 for windows without readings
+
+    >>> count_increases_batch([199, 200, 208, 210, 200, 207, 240, 269, 260, 263], [1, 3, 0])
+    [7, 5, 0]
+    """
+    import numpy as np
+    depths = np.asarray(depths)
+    return [int(np.count_nonzero(depths[w:] > depths[:-w])) if 0 < w < len(depths) else 0 for w in window_sizes]
+
+
+def count_changes(inputs, window_size=1):
+    return count_increases(inputs, window_size)
+
+
 def main(file):
     depths = read_numbers(file)
 
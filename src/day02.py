@@ -1,45 +1,138 @@
 #!/usr/bin/env python3
+import mmap
+import os
+from array import array
+from collections import namedtuple
+from functools import reduce
 
 # --- Day 2: Dive! ---
 
+# The net effect of a run of instructions, starting at aim 0: forward, depth and aim change
+Summary = tuple[int, int, int]
 
-def read_instruction_line(line):
-    parts = line.split()
-    return parts[0], int(parts[1])
+FORWARD, UP, DOWN = 0, -1, 1
+MOVES = {b"forward": FORWARD, b"up": UP, b"down": DOWN}
+CHUNK_SIZE = 32 << 20  # bytes of instructions that a worker summarizes at a time
+SLICE_SIZE = 1 << 20  # bytes of instructions that are split into words at a time
 
 
-def read_instructions(filename):
-    with open(filename) as f:
-        return [*map(read_instruction_line, f.readlines())]
+# the instructions as two columns: array('b') of FORWARD, UP or DOWN, and array('i') of amounts
+Course = namedtuple("Course", ["moves", "amounts"])
 
 
-def follow_incorrect(instructions):
-    pos, depth = 0, 0
-    for (move, amount) in instructions:
-        if move == "forward":
-            pos += amount
-        elif move == "up":
-            depth -= amount
-        elif move == "down":
-            depth += amount
-        else:
-            raise ValueError(f"Invalid Instruction: {move}")
+def read_instructions(filename) -> Course:
+    with open(filename, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return parse_course(b'')
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return parse_course(data)
+
+
+def process_inputs(inputs: str) -> Course:
+    return parse_course(inputs.encode())
+
+
+def parse_course(data, start: int = 0, end: int = None, slice_size: int = SLICE_SIZE) -> Course:
+    """
+    Parse instructions into two compact columns: a signed byte per move (its effect on the aim, 0 for forward) and a
+    32-bit amount, five bytes per instruction in total. The data is split into words a slice at a time, each slice
+    ending at a line end, so parsing a memory-mapped file only ever holds one slice in memory besides the columns.
+    :param data: The instructions as bytes or a memory-mapped file
+    :param start: The offset of the first instruction to parse
+    :param end: The offset after the last instruction to parse, defaults to the end of the data
+    :param slice_size: The number of bytes to split at a time
+    :return: The parsed instructions
+
+    >>> parse_course(b"forward 5\\ndown 5\\nup 3\\n", slice_size=4)
+    Course(moves=array('b', [0, 1, -1]), amounts=array('i', [5, 5, 3]))
+    """
+    end = len(data) if end is None else end
+    course = Course(array('b'), array('i'))
+    while start < end:
+        stop = data.find(b'\n', min(start + slice_size, end), end) + 1 or end
+        words = data[start:stop].split()
+        try:
+            course.moves.extend(map(MOVES.__getitem__, words[0::2]))
+        except KeyError as e:
+            raise ValueError(f"Invalid Instruction: {e.args[0].decode()}") from None
+        course.amounts.extend(map(int, words[1::2]))
+        start = stop
+    return course
+
+
+def follow_incorrect(course: Course):
+    pos, _, aim = summarize(course)
+    return pos, aim
+
+
+def follow(course: Course):
+    pos, depth, _ = summarize(course)
     return pos, depth
 
 
-def follow(instructions):
+def summarize(course: Course) -> Summary:
+    """
+    Follow the instructions starting from position, depth and aim 0. Starting at aim a instead only adds
+    a * forward to the depth, so the summary works for any starting point, and the aim change is the depth of part 1.
+    """
     pos, depth, aim = 0, 0, 0
-    for (move, amount) in instructions:
-        if move == "forward":
+    for move, amount in zip(*course):
+        if move:
+            aim += move * amount
+        else:
             pos += amount
             depth += amount * aim
-        elif move == "up":
-            aim -= amount
-        elif move == "down":
-            aim += amount
-        else:
-            raise ValueError(f"Invalid Instruction: {move}")
-    return pos, depth
+    return pos, depth, aim
+
+
+def compose(first: Summary, second: Summary) -> Summary:
+    """
+    Combine the summaries of two consecutive runs of instructions into the summary of both.
+
+    >>> first, second = process_inputs("forward 5 down 5 forward 8"), process_inputs("up 3 down 8 forward 2")
+    >>> compose(summarize(first), summarize(second))
+    (15, 60, 10)
+    """
+    pos, depth, aim = second
+    return first[0] + pos, first[1] + depth + first[2] * pos, first[2] + aim
+
+
+def summarize_range(filename, start: int, end: int) -> Summary:
+    with open(filename, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        return summarize(parse_course(data, start, end))
+
+
+def line_boundaries(filename, chunk_size: int) -> list[int]:
+    """
+    :return: Offsets that split the file into chunks of about the given number of bytes, all at the start of a line
+    """
+    size = os.path.getsize(filename)
+    offsets = [0]
+    with open(filename, 'rb') as f:
+        while offsets[-1] + chunk_size < size:
+            f.seek(offsets[-1] + chunk_size)
+            f.readline()
+            offsets.append(f.tell())
+    offsets.append(size)
+    return sorted(set(offsets))
+
+
+def follow_parallel(filename, jobs: int = None, chunk_size: int = CHUNK_SIZE) -> Summary:
+    """
+    Summarize a (large) instruction file in chunks spread over worker processes, and compose the chunk summaries.
+    The chunks are bounded in size, so the memory a worker needs doesn't grow with the file.
+    :param filename: The name of the instruction file
+    :param jobs: The number of worker processes, defaults to the number of CPUs
+    :param chunk_size: The number of bytes per chunk
+    :return: The summary of all instructions: the position, the depth of part 2, and the depth of part 1
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    jobs = jobs or os.cpu_count()
+    offsets = line_boundaries(filename, chunk_size)
+    ranges = [(start, end) for start, end in zip(offsets, offsets[1:]) if start < end]
+    with ProcessPoolExecutor(jobs) as executor:
+        summaries = executor.map(summarize_range, [filename] * len(ranges), *zip(*ranges))
+        return reduce(compose, summaries, (0, 0, 0))
 
 
 def main(file):
@@ -1,70 +1,129 @@
 #!/usr/bin/env python3
-from collections import namedtuple
+from collections import defaultdict, namedtuple
 
 # --- Day 4: Giant Squid ---
 
 
 Row = list[int]
-Col = list[int]
 Board = list[Row]
 Result = namedtuple("Result", ["round", "score"])
 
 
 def main(file):
     inputs = read_input(file)
-    assert get_score_for_best_board(example) == 4512
-    print(get_score_for_best_board(inputs))
-    assert get_score_for_worst_board(example) == 1924
-    print(get_score_for_worst_board(inputs))
+    assert get_scores(example) == (4512, 1924)
+    best, worst = get_scores(inputs)
+    print(best)
+    print(worst)
 
 
 def get_score_for_best_board(inputs: str) -> int:
-    numbers, boards = process_inputs(inputs)
-    return get_ultimate_score(boards, numbers)
+    return get_scores(inputs)[0]
 
 
 def get_score_for_worst_board(inputs: str) -> int:
-    numbers, boards = process_inputs(inputs)
-    return get_ultimate_score(boards, numbers, False)
-
-
-def get_ultimate_score(boards: list[Board], numbers: list[int], i_want_to_win: bool = True) -> int:
-    results = [result for result in [get_result(board, numbers) for board in boards] if result.round > -1]
-    results.sort(key=lambda r: r.round)
-    if i_want_to_win:
-        best_result = results[0]
-    else:
-        best_result = results[-1]
-    return numbers[best_result.round] * best_result.score
-
-
-def get_result(board: Board, numbers: list[int]) -> Result:
-    for n in range(len(numbers)):
-        numbers_so_far = numbers[0:n+1]
-        if rows_bingo(board, numbers_so_far) or cols_bingo(board, numbers_so_far):
-            return Result(n, get_remaining_board_value(board, numbers_so_far))
-    return Result(-1, -1)
-
-
-def rows_bingo(board: Board, numbers: list[int]) -> bool:
-    return any([bingo(row, numbers) for row in board])
-
-
-def cols_bingo(board: Board, numbers: list[int]) -> bool:
-    return any([bingo(col, numbers) for col in transpose(board)])
-
-
-def bingo(numbers_from_board: list[int], drawn_numbers: list[int]) -> bool:
-    return not set(numbers_from_board) - set(drawn_numbers)
-
-
-def get_remaining_board_value(board: Board, numbers: list[int]):
-    flattened_board = [number for row in board for number in row]
-    return sum(set(flattened_board) - set(numbers))
-
-
-def transpose(board: Board) -> list[Col]:
-    return [*map(list, zip(*board))]
+    return get_scores(inputs)[1]
+
+
+def get_scores(inputs: str, engine: str = "numpy") -> (int, int):
+    """
+    Score the first and the last board to win. Ties go to the board that comes first for the first winner, and to the
+    one that comes last for the last winner.
+    :param inputs: The drawn numbers and the boards
+    :param engine: "numpy" to stack all boards in one array, or "python" to draw the numbers one by one with play(),
+    which needs no NumPy and is quicker on small inputs
+    :return: The final score of the first and of the last board to win
+
+    >>> get_scores(example)
+    (4512, 1924)
+    >>> get_scores(example, engine="python")
+    (4512, 1924)
+    """
+    if engine == "numpy":
+        return get_scores_numpy(inputs)
+    if engine == "python":
+        numbers, boards = process_inputs(inputs)
+        results = [(r.round, b, r.score) for b, r in enumerate(play(boards, numbers)) if r.round > -1]
+        first = min(results, key=lambda r: (r[0], r[1]))
+        last = max(results, key=lambda r: (r[0], r[1]))
+        return tuple(numbers[r] * score for r, _, score in (first, last))
+    raise ValueError(f"unknown engine {engine!r}, expected 'numpy' or 'python'")
+
+
+def get_scores_numpy(inputs: str) -> (int, int):
+    """
+    Score the first and the last board to win, with all boards stacked in one NumPy array. Replacing every number on
+    the boards by the turn in which it's drawn, a line is complete at the latest turn in it, and a board wins at the
+    earliest turn one of its lines is complete; that gives the winning turn of every board in a few array operations.
+    """
+    import numpy as np
+    draws, boards = process_input_arrays(inputs)
+    never = len(draws)
+    # look up the turn of every number on the boards among the sorted distinct draws, which works for any numbers
+    drawn, first_turn = np.unique(draws, return_index=True)  # a number drawn twice counts from its first draw
+    found = np.minimum(np.searchsorted(drawn, boards), len(drawn) - 1)
+    turns = np.where(drawn[found] == boards, first_turn[found], never)
+    wins = np.minimum(turns.max(axis=2).min(axis=1), turns.max(axis=1).min(axis=1))
+    winners = np.flatnonzero(wins < never)
+    first = winners[np.argmin(wins[winners])]
+    last = winners[::-1][np.argmax(wins[winners][::-1])]
+    return tuple(int(draws[wins[b]]) * int(boards[b][turns[b] > wins[b]].sum()) for b in (first, last))
+
+
+def process_input_arrays(inputs: str):
+    """
+    :return: The drawn numbers as a 1D array, and the boards stacked in an array of shape (boards, rows, columns)
+    """
+    import numpy as np
+    numbers, boards = inputs.split('\n\n', 1)
+    first_board = boards.split('\n\n', 1)[0].split('\n')
+    shape = (-1, len(first_board), len(first_board[0].split()))
+    return np.array(numbers.split(','), dtype=np.int64), np.array(boards.split(), dtype=np.int64).reshape(shape)
+
+
+def play(boards: list[Board], numbers: list[int]) -> list[Result]:
+    """
+    Draw the numbers once for all boards. An index from each number to the cells it occupies makes marking a number
+    cost only as much as the cells it's on, and counting the hits per row and column tells right away when one is full.
+    :param boards: The bingo boards
+    :param numbers: The numbers in the order they are drawn
+    :return: The round in which each board wins and the sum of its unmarked numbers then, or Result(-1, -1) if it
+    never wins
+
+    >>> numbers, boards = process_inputs(example)
+    >>> play(boards, numbers)
+    [Result(round=13, score=137), Result(round=14, score=148), Result(round=11, score=188)]
+    """
+    height, width = len(boards[0]), len(boards[0][0])
+    index = defaultdict(list)
+    for b, board in enumerate(boards):
+        for r, row in enumerate(board):
+            for c, number in enumerate(row):
+                index[number].append((b, b * height + r, b * width + c))
+    row_hits = [0] * (len(boards) * height)
+    col_hits = [0] * (len(boards) * width)
+    unmarked = [sum(map(sum, board)) for board in boards]
+    results = [Result(-1, -1)] * len(boards)
+    playing = len(boards)
+    drawn = set()
+    for n, number in enumerate(numbers):
+        if number in drawn or number not in index:
+            continue
+        drawn.add(number)
+        winners = []
+        for b, row, col in index[number]:
+            unmarked[b] -= number
+            row_hits[row] += 1
+            col_hits[col] += 1
+            if row_hits[row] == width or col_hits[col] == height:
+                winners.append(b)
+        for b in winners:
+            if results[b].round < 0:
+                results[b] = Result(n, unmarked[b])
+                playing -= 1
+        if not playing:
+            break
+    return results
 
 
 def process_inputs(inputs: str) -> (list[int], list[Board]):
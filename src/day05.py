@@ -1,15 +1,18 @@
 #!/usr/bin/env python3
-
-from collections import Counter
 import itertools
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from math import inf
 
 # --- Day 5: Hydrothermal Venture ---
 
 
-flatten = itertools.chain.from_iterable
-
 Point = (int, int)
 Line = list[Point]
+Interval = (int, int)
+# a line direction as (a, b), so that a * x + b * y is the same for all points on a line
+Direction = (int, int)
+HORIZONTAL, VERTICAL, DIAGONAL, ANTI_DIAGONAL = DIRECTIONS = (0, 1), (1, 0), (1, -1), (1, 1)
 
 
 def main(file):
@@ -21,11 +24,156 @@ def main(file):
 
 
 def count_overlaps(inputs: str, with_diagonals: bool = False) -> int:
+    segments = process_input_array(inputs)
+    if not with_diagonals:
+        segments = segments[(segments[:, 0] == segments[:, 2]) | (segments[:, 1] == segments[:, 3])]
+    return int((rasterize(segments) >= 2).sum())
+
+
+def rasterize(segments) -> "np.ndarray":
+    """
+    Draw the lines onto a grid that holds one byte per point. In the flattened grid, every horizontal, vertical or
+    diagonal line is a strided slice, so each line is drawn with a single NumPy operation. The counts saturate at 2,
+    which is all the overlap count needs, so a byte never overflows.
+    :param segments: The lines as an array of rows x1, y1, x2, y2
+    :return: A grid with per point 0, 1, or 2 for two or more lines
+
+    >>> rasterize(process_input_array("0,0 -> 2,2\\n2,0 -> 0,2\\n0,1 -> 2,1"))
+    array([[1, 0, 1],
+           [1, 2, 1],
+           [1, 0, 1]], dtype=uint8)
+    """
+    import numpy as np
+    width = int(max(segments[:, 0].max(), segments[:, 2].max())) + 1 if len(segments) else 0
+    height = int(max(segments[:, 1].max(), segments[:, 3].max())) + 1 if len(segments) else 0
+    grid = np.zeros((height, width), dtype=np.uint8)
+    cells = grid.reshape(-1)
+    for x1, y1, x2, y2 in segments.tolist():
+        if (y1, x1) > (y2, x2):
+            x1, y1, x2, y2 = x2, y2, x1, y1
+        step = (y2 > y1) * width + (x2 > x1) - (x2 < x1)
+        start = y1 * width + x1
+        line = cells[start:start + step * max(y2 - y1, abs(x2 - x1)) + 1:max(step, 1)]
+        line[:] = np.minimum(line, 1) + 1
+    return grid
+
+
+def process_input_array(inputs: str) -> "np.ndarray":
+    """
+    :return: The lines as an array with a row x1, y1, x2, y2 per line
+    """
+    import numpy as np
+    return np.array(inputs.replace(' -> ', ',').replace(',', ' ').split(), dtype=np.int64).reshape(-1, 4)
+
+
+def count_overlaps_sweep(inputs: str, with_diagonals: bool = False) -> int:
+    """
+    Count the points where lines overlap without a grid, so the cost depends on the number of lines rather than on the
+    range of the coordinates. Lines of the same direction only overlap when they lie on the same line, where merging
+    their intervals in a sweep finds the stretches covered twice; lines of different directions meet in single points.
+    :param inputs: The lines, one per row
+    :param with_diagonals: Whether to include the diagonal lines
+    :return: The number of points covered by at least two lines
+
+    >>> count_overlaps_sweep(example), count_overlaps_sweep(example, True)
+    (5, 12)
+    >>> count_overlaps_sweep("0,0 -> 4000000000,4000000000\\n0,4000000000 -> 4000000000,0\\n1,1 -> 1,4", True)
+    2
+    """
     lines = process_inputs(inputs)
     if not with_diagonals:
         lines = [x for x in lines if not is_diagonal(x)]
-    complete = complete_lines(lines)
-    return len(find_overlaps(complete))
+    intervals = {direction: defaultdict(list) for direction in DIRECTIONS}
+    for (x1, y1), (x2, y2) in lines:
+        direction = get_direction(x1, y1, x2, y2)
+        ts = sorted((y1, y2) if direction == VERTICAL else (x1, x2))
+        intervals[direction][on_line(direction, x1, y1)].append(tuple(ts))
+    covered, multiple = {}, {}
+    for direction, per_line in intervals.items():
+        covered[direction] = {key: merge(spans, 1) for key, spans in per_line.items()}
+        multiple[direction] = {key: merge(spans, 2) for key, spans in per_line.items()}
+    count = sum(hi - lo + 1 for per_line in multiple.values() for spans in per_line.values() for lo, hi in spans)
+    for x, y in crossings(covered):
+        # a crossing is one more overlap if it isn't counted yet, and was counted too often if it's in several stretches
+        counted = sum(contains(multiple[d].get(on_line(d, x, y), []), position(d, x, y)) for d in DIRECTIONS)
+        count += 1 - counted if counted != 1 else 0
+    return count
+
+
+def get_direction(x1: int, y1: int, x2: int, y2: int) -> Direction:
+    if y1 == y2:
+        return HORIZONTAL
+    if x1 == x2:
+        return VERTICAL
+    return DIAGONAL if x2 - x1 == y2 - y1 else ANTI_DIAGONAL
+
+
+def on_line(direction: Direction, x: int, y: int) -> int:
+    """
+    :return: The key a * x + b * y of the line in the given direction through the point, equal for all its points
+    """
+    a, b = direction
+    return a * x + b * y
+
+
+def position(direction: Direction, x: int, y: int) -> int:
+    return y if direction == VERTICAL else x
+
+
+def point_at(direction: Direction, key: int, t: int) -> Point:
+    a, b = direction
+    return (key, t) if direction == VERTICAL else (t, (key - a * t) // b)
+
+
+def merge(spans: list[Interval], depth: int) -> list[Interval]:
+    """
+    Sweep over the starts and ends of the intervals on one line.
+    :return: The stretches covered by at least depth intervals, sorted and disjoint
+
+    >>> merge([(0, 5), (3, 8), (4, 4), (10, 12)], 1), merge([(0, 5), (3, 8), (4, 4), (10, 12)], 2)
+    ([(0, 8), (10, 12)], [(3, 5)])
+    """
+    events = sorted([(lo, 1) for lo, _ in spans] + [(hi + 1, -1) for _, hi in spans])
+    result, active, start = [], 0, None
+    for t, change in events:
+        active += change
+        if active >= depth and start is None:
+            start = t
+        elif active < depth and start is not None:
+            if result and result[-1][1] == start - 1:
+                start = result.pop()[0]
+            if t > start:
+                result.append((start, t - 1))
+            start = None
+    return result
+
+
+def contains(spans: list[Interval], t: int) -> bool:
+    i = bisect_right(spans, (t, inf)) - 1
+    return i >= 0 and spans[i][0] <= t <= spans[i][1]
+
+
+def crossings(covered: dict[Direction, dict[int, list[Interval]]]) -> set[Point]:
+    """
+    Find the grid points where covered stretches of different directions meet. The key of the other direction changes
+    linearly along a stretch, so only the lines with a key between those at both ends have to be checked.
+    """
+    points = set()
+    for first, second in itertools.combinations(DIRECTIONS, 2):
+        others = sorted((key, lo, hi) for key, spans in covered[second].items() for lo, hi in spans)
+        keys = [key for key, _, _ in others]
+        (a1, b1), (a2, b2) = first, second
+        determinant = a1 * b2 - a2 * b1
+        for key, spans in covered[first].items():
+            for lo, hi in spans:
+                ends = sorted(on_line(second, *point_at(first, key, t)) for t in (lo, hi))
+                for other, other_lo, other_hi in others[bisect_left(keys, ends[0]):bisect_right(keys, ends[1])]:
+                    x, x_rest = divmod(key * b2 - other * b1, determinant)
+                    y, y_rest = divmod(a1 * other - a2 * key, determinant)
+                    if not x_rest and not y_rest and lo <= position(first, x, y) <= hi \
+                            and other_lo <= position(second, x, y) <= other_hi:
+                        points.add((x, y))
+    return points
 
 
 def process_inputs(inputs: str) -> list[Line]:
@@ -47,34 +195,6 @@ def is_diagonal(line: Line) -> bool:
     return line[0][0] != line[1][0] and line[0][1] != line[1][1]
 
 
-def complete_lines(lines: list[Line]) -> list[Line]:
-    return list(map(complete_line, lines))
-
-
-def complete_line(line: Line) -> Line:
-    xs = get_range(line[0][0], line[1][0])
-    ys = get_range(line[0][1], line[1][1])
-    if len(xs) == 1:
-        xs *= len(ys)
-    elif len(ys) == 1:
-        ys *= len(xs)
-    return list(zip(xs, ys))
-
-
-def get_range(a: int, b: int) -> list[int]:
-    if a == b:
-        return [a]
-    if a < b:
-        return list(range(a, b+1))
-    if a > b:
-        return list(range(a, b-1, -1))
-
-
-def find_overlaps(lines: list[Line]) -> set[Point]:
-    points = list(flatten(lines))
-    return {point for (point, count) in Counter(points).items() if count > 1}
-
-
 def read_input(filename):
     with open(filename) as f:
         contents = f.read().strip()
@@ -1,23 +1,78 @@
 #!/usr/bin/env python3
-from functools import reduce
+from collections import namedtuple
+from functools import cache, reduce
 
 # --- Day 6: Lanternfish ---
 
 
+Matrix = list[list[int]]
+Forecast = namedtuple("Forecast", ["days", "total", "counts"])
+
+# new counts = TRANSITION x old counts: every timer counts down, and timer 0 restarts at 6 and spawns a fish at 8
+TRANSITION = [[1 if j == i + 1 or (i, j) in ((6, 0), (8, 0)) else 0 for j in range(9)] for i in range(9)]
+SIMULATION_LIMIT = 10_000  # simulating is faster than the first matrix powers up to about here
+KNOWN_LIMIT = 32  # starting populations whose counts forecast() keeps
+KNOWN_COUNTS: dict[tuple[tuple[int, ...], int], dict[int, tuple[int, ...]]] = {}
+
+
 def main(file):
     inputs = read_input(file)
     assert count_after_days(example, 18) == 26
     assert count_after_days(example, 80) == 5934
-    print(count_after_days(inputs, 80))
     assert count_after_days(example, 256) == 26984457539
-    print(count_after_days(inputs, 256))
+    fish = [int(x) for x in inputs.split(',')]
+    for f in forecast(fish, [80, 256]):
+        print(f.total)
 
 
-def count_after_days(inputs: str, days: int) -> int:
+def count_after_days(inputs: str, days: int, modulus: int = None) -> int:
     fish = [int(x) for x in inputs.split(',')]
     start = reduce(tally, fish, [0] * 9)
-    final = count_down(start, days)
-    return sum(final)
+    final = count_down(start, days, modulus)
+    return sum(final) % modulus if modulus else sum(final)
+
+
+def forecast(fish: list[int], horizons: list[int], modulus: int = None) -> list[Forecast]:
+    """
+    Count the fish at several horizons in one sweep: every horizon continues from the one before it. The counts of
+    the last KNOWN_LIMIT starting populations are kept in KNOWN_COUNTS, keyed on the population and the modulus, so
+    asking again about the same fish only computes horizons beyond the known ones.
+    :param fish: The timer value of every fish
+    :param horizons: The numbers of days to count the fish after
+    :param modulus: If given, count modulo this number
+    :return: The total and the number of fish per timer value for every horizon, in the order of the horizons
+
+    >>> [(f.days, f.total) for f in forecast([3, 4, 3, 1, 2], [80, 18, 256])]
+    [(80, 5934), (18, 26), (256, 26984457539)]
+    >>> forecast([3, 4, 3, 1, 2], [18])[0].counts
+    (3, 5, 3, 2, 2, 1, 5, 1, 4)
+    >>> forecast([3, 4, 3, 1, 2], [-1])
+    Traceback (most recent call last):
+    ...
+    ValueError: horizons must not be negative, got -1
+    """
+    if any(days < 0 for days in horizons):
+        raise ValueError(f"horizons must not be negative, got {min(horizons)}")
+    start = tuple(reduce(tally, fish, [0] * 9))
+    known = known_counts(start, modulus)
+    for days in sorted(set(horizons) - known.keys()):
+        before = max(d for d in known if d < days)
+        known[days] = tuple(count_down(list(known[before]), days - before, modulus))
+    return [Forecast(days, sum(known[days]) % modulus if modulus else sum(known[days]), known[days])
+            for days in horizons]
+
+
+def known_counts(start: tuple[int, ...], modulus: int = None) -> dict[int, tuple[int, ...]]:
+    """
+    :return: The counts known so far for this starting population, by day, to be extended in place. The population
+    used longest ago is forgotten once more than KNOWN_LIMIT are kept.
+    """
+    key = (start, modulus)
+    known = KNOWN_COUNTS.pop(key, None) or {0: start}
+    KNOWN_COUNTS[key] = known  # (re)insert last, so the dict runs from least to most recently used
+    if len(KNOWN_COUNTS) > KNOWN_LIMIT:
+        del KNOWN_COUNTS[next(iter(KNOWN_COUNTS))]
+    return known
 
 
 def tally(counts: list[int], item: int) -> list[int]:
@@ -25,13 +80,58 @@ def tally(counts: list[int], item: int) -> list[int]:
     return counts
 
 
-def count_down(counts: list[int], days: int) -> list[int]:
-    new_counts = counts[1:] + counts[0:1]
-    new_counts[6] += counts[0]
-    if days > 1:
-        return count_down(new_counts, days - 1)
-    else:
-        return new_counts
+def count_down(counts: list[int], days: int, modulus: int = None) -> list[int]:
+    """
+    Let the fish multiply for the given number of days. Short horizons are simulated day by day, longer ones jump ahead
+    with powers of the transition matrix. The population grows about 9% a day, so exact counts for very long horizons
+    are too large to hold; a modulus keeps them small, and then even 10^12 days take only a few vector products.
+    :param counts: The number of fish per timer value, 0 to 8
+    :param days: The number of days to simulate
+    :param modulus: If given, count modulo this number
+    :return: The number of fish per timer value after the given days
+
+    >>> count_down([0, 1, 1, 2, 1, 0, 0, 0, 0], 18)
+    [3, 5, 3, 2, 2, 1, 5, 1, 4]
+    >>> count_down([0, 1, 1, 2, 1, 0, 0, 0, 0], 4321) == simulate([0, 1, 1, 2, 1, 0, 0, 0, 0], 4321)
+    True
+    """
+    if days <= SIMULATION_LIMIT:
+        return simulate(counts, days, modulus)
+    for bit in range(days.bit_length()):
+        if days >> bit & 1:
+            counts = multiply(transition_power(bit, modulus), counts, modulus)
+    return counts
+
+
+def simulate(counts: list[int], days: int, modulus: int = None) -> list[int]:
+    """
+    Count down in a ring buffer of the nine timer values: on day d, the slot of timer 0 is d % 9. Its fish give birth
+    to the same number of new fish at timer 8, which is the very same slot on the next day, so only the parents have
+    to be added to the slot that becomes timer 6.
+    """
+    buffer = counts[:]
+    for day in range(days):
+        buffer[(day + 7) % 9] += buffer[day % 9]
+        if modulus:
+            buffer[(day + 7) % 9] %= modulus
+    return [buffer[(days + timer) % 9] for timer in range(9)]
+
+
+def multiply(matrix: Matrix, counts: list[int], modulus: int = None) -> list[int]:
+    result = [sum(a * b for a, b in zip(row, counts)) for row in matrix]
+    return [x % modulus for x in result] if modulus else result
+
+
+@cache
+def transition_power(bit: int, modulus: int = None) -> Matrix:
+    """
+    :return: The transition matrix to the power 2 ** bit, which moves the fish counts that many days ahead
+    """
+    if bit == 0:
+        return TRANSITION
+    half = transition_power(bit - 1, modulus)
+    columns = [multiply(half, column, modulus) for column in zip(*half)]
+    return [list(row) for row in zip(*columns)]
 
 
 def read_input(filename):
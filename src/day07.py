@@ -1,11 +1,21 @@
 #!/usr/bin/env python3
-from functools import reduce
-from aocd import data, submit
+from bisect import bisect_left
+from collections.abc import Callable
+from itertools import accumulate
+from puzzle_input import get_data
 
 # --- Day 7: The Treachery of Whales ---
 
 
+# the fuel cost of moving a given distance; these work on single numbers and on NumPy arrays alike
+Cost = Callable[[int], int]
+LINEAR: Cost = lambda d: d
+TRIANGULAR: Cost = lambda d: d * (d + 1) // 2
+QUADRATIC: Cost = lambda d: d * d
+
+
 def main():
+    data = get_data(7)
     inputs = [int(x) for x in data.split(',')]
     ex = [int(x) for x in example.split(',')]
     ex1 = solve(ex)
@@ -17,27 +27,96 @@ def main():
 
 
 def solve(nums: list[int]) -> int:
-    costs: list[int] = []
-    for i in range(min(nums), max(nums)+1):
-        cost = [abs(x-i) for x in nums]
-        costs.append(sum(cost))
-    return min(costs)
+    crabs = Crabs(nums)
+    return crabs.distance_sum(crabs.median())
 
 
 def solve2(nums: list[int]) -> int:
-    costs: list[int] = []
-    for position in range(min(nums), max(nums)+1):
-        func = get_cost_function(position)
-        c = reduce(func, nums, 0)
-        costs.append(c)
-    return min(costs)
-
-
-def get_cost_function(pos: int):
-    def q(current: int, num: int) -> int:
-        distance = abs(num - pos)
-        return current + (distance * (distance + 1) // 2)
-    return q
+    """
+    The triangular cost is lowest within half a step of the mean, so only the positions around the mean are checked.
+    The cost is convex, so if neither of them is lower than both its neighbours, a binary search over the range
+    finds the real minimum instead.
+    """
+    crabs = Crabs(nums)
+    candidates = {crabs.total // crabs.count, -(-crabs.total // crabs.count)}
+    best = min(candidates, key=crabs.triangular_sum)
+    cost = crabs.triangular_sum(best)
+    if cost <= crabs.triangular_sum(best - 1) and cost <= crabs.triangular_sum(best + 1):
+        return cost
+    return crabs.triangular_sum(minimize(crabs.triangular_sum, crabs.positions[0], crabs.positions[-1]))
+
+
+class Crabs:
+    """
+    The crab positions, sorted once, with prefix sums that give the total fuel cost at any position in O(log n).
+
+    >>> crabs = Crabs([16, 1, 2, 0, 4, 2, 7, 1, 2, 14])
+    >>> crabs.distance_sum(2), crabs.triangular_sum(5)
+    (37, 168)
+    """
+    def __init__(self, positions: list[int]):
+        self.positions = sorted(positions)
+        self.prefix = list(accumulate(self.positions, initial=0))
+        self.count = len(self.positions)
+        self.total = self.prefix[-1]
+        self.square_total = sum(x * x for x in self.positions)
+
+    def median(self) -> int:
+        return self.positions[(self.count - 1) // 2]
+
+    def distance_sum(self, target: int) -> int:
+        below = bisect_left(self.positions, target)
+        return (target * below - self.prefix[below]) + (self.total - self.prefix[below] - target * (self.count - below))
+
+    def triangular_sum(self, target: int) -> int:
+        # d * (d + 1) / 2 summed over all distances d is half of the sum of squares plus the sum of the distances
+        squares = self.square_total - 2 * target * self.total + self.count * target * target
+        return (squares + self.distance_sum(target)) // 2
+
+
+def align(nums: list[int], cost: Cost, weights: list[int] = None) -> (int, int):
+    """
+    Find the cheapest position to align the crabs for any convex fuel cost per distance. The total cost is then
+    convex in the position as well, so a binary search on its slope takes O(log range) evaluations, each of which is
+    one vectorised pass over the crabs. The costs are summed as 64-bit integers.
+    :param nums: The crab positions
+    :param cost: The fuel cost of moving a distance, applied to a NumPy array of distances, e.g. TRIANGULAR
+    :param weights: Optionally, how many times each crab's cost counts
+    :return: The best position and the total fuel cost there
+
+    >>> ex = [16, 1, 2, 0, 4, 2, 7, 1, 2, 14]
+    >>> align(ex, LINEAR), align(ex, TRIANGULAR), align(ex, QUADRATIC)
+    ((2, 37), (5, 168), (5, 291))
+    >>> align(ex, LINEAR, weights=[10, 1, 1, 1, 1, 1, 1, 1, 1, 1])
+    (16, 111)
+    """
+    import numpy as np
+    positions = np.array(nums, dtype=np.int64)
+    weights = None if weights is None else np.array(weights, dtype=np.int64)
+
+    def total(target: int) -> int:
+        costs = cost(np.abs(positions - target))
+        return int(costs.sum() if weights is None else costs @ weights)
+
+    best = minimize(total, int(positions.min()), int(positions.max()))
+    return best, total(best)
+
+
+def minimize(cost, lo: int, hi: int) -> int:
+    """
+    Binary search for the lowest point of a convex function on the integers lo to hi, following the slope.
+    :return: The position with the lowest cost, the leftmost one if there are several
+
+    >>> minimize(lambda x: (x - 7) ** 2, -100, 100)
+    7
+    """
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if cost(mid) <= cost(mid + 1):
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
 
 
 example = """
@@ -1,14 +1,16 @@
 #!/usr/bin/env python3
 
-from aocd import data, submit
-from collections import Counter
+from puzzle_input import get_data
+from rendering import visual
 
 # --- Day 8: Seven Segment Search ---
 
+SEGMENT_BITS = {c: 1 << i for i, c in enumerate("abcdefg")}
 normal_digits = ["abcefg", "cf", "acdeg", "acdfg", "bcdf", "abdfg", "abdefg", "acf", "abcdefg", "abcdfg"]
 
 
 def main():
+    data = get_data(8)
     ex1 = count_easy_digits(example)
     assert ex1 == 26, f"expected 26, but got {ex1}"
     answer1 = count_easy_digits(data)
@@ -19,112 +21,67 @@ def main():
     assert ex3 == 61229, f"expected 61229, but got {ex3}"
     answer2 = count_outputs(data)
     assert answer2 == 908067, f"expected 908067, but got {answer2}"
-    # alt(example)
-
-
-# TODO alternatively, try using bitmasks
-
-
-# only on Python 3.10; https://www.reddit.com/r/adventofcode/comments/rbj87a/2021_day_8_solutions/hnoyy04/?utm_source=reddit&utm_medium=web2x&context=3
-# def alt(inputs: str):
-#     s = 0
-#     for x, y in [x.split('|') for x in inputs.split('\n')]:  # split signal and output
-#         l = {len(s): set(s) for s in x.split()}  # get number of segments
-#         n = ''
-#         for o in map(set, y.split()):  # loop over output digits
-#             match len(o), len(o & l[4]), len(o & l[2]):  # mask with known digits
-#                 case 2, _, _:
-#                     n += '1'
-#                 case 3, _, _:
-#                     n += '7'
-#                 case 4, _, _:
-#                     n += '4'
-#                 case 7, _, _:
-#                     n += '8'
-#                 case 5, 2, _:
-#                     n += '2'
-#                 case 5, 3, 1:
-#                     n += '5'
-#                 case 5, 3, 2:
-#                     n += '3'
-#                 case 6, 4, _:
-#                     n += '9'
-#                 case 6, 3, 1:
-#                     n += '6'
-#                 case 6, 3, 2:
-#                     n += '0'
-#         s += int(n)
-#     print(s)
-
-
-def read_inputs(inputs: str) -> list[tuple[list[str], list[str]]]:
-    result = []
-    displays = inputs.split('\n')
-    for d in displays:
-        ds_s, out_s = d.split(' | ')
-        ds = ds_s.split(' ')
-        out = out_s.split(' ')
-        result.append((sort_strings(ds), sort_strings(out)))
-    return result
 
 
-def sort_strings(inputs: list[str]) -> list[str]:
+def to_mask(pattern: str) -> int:
+    """
+    :return: The segments of the pattern as a 7-bit number, bit 0 for segment a up to bit 6 for segment g
+
+    >>> bin(to_mask("cf")), bin(to_mask("bcdf"))
+    ('0b100100', '0b101110')
+    """
+    return sum(map(SEGMENT_BITS.__getitem__, pattern))
+
+
+# Every digit has a unique number of segments, and number of segments in common with 4 and with 1. That doesn't
+# depend on the wiring, so it identifies scrambled digits once the patterns of 1 and 4 (the only ones with 2 and 4
+# segments) are known.
+SHAPES = {(m.bit_count(), (m & to_mask(normal_digits[4])).bit_count(), (m & to_mask(normal_digits[1])).bit_count()): d
+          for d, m in enumerate(map(to_mask, normal_digits))}
+assert len(SHAPES) == 10
+
+
+def read_displays(inputs: str) -> list[tuple[list[int], list[int]]]:
     result = []
-    for s in inputs:
-        result.append("".join(sorted(s)))
+    for d in inputs.split('\n'):
+        patterns, output = d.split(' | ')
+        result.append(([*map(to_mask, patterns.split())], [*map(to_mask, output.split())]))
     return result
 
 
 def count_easy_digits(inputs: str) -> int:
-    displays = read_inputs(inputs)
-    easy_lengths = [x for x in [2, 3, 4, 7]]
-    result = 0
-    for _, out in displays:
-        easy = list(filter(lambda x: len(x) in easy_lengths, out))
-        result += len(easy)
-    return result
+    return sum(m.bit_count() in (2, 3, 4, 7) for _, output in read_displays(inputs) for m in output)
 
 
 def count_outputs(inputs: str) -> int:
     count = 0
-    displays = read_inputs(inputs)
-    for occ, out in displays:
-        key = find_edges_by_unique_counts(occ)
-        key = find_edges_by_digit_length(occ, key)
-        result = []
-        for o in out:
-            d = decode(o, key)
-            result.append(str(d))
-        output_digits = "".join(result)
-        display(output_digits)
-        count += int(output_digits)
+    for patterns, output in read_displays(inputs):
+        table = get_decoding_table(patterns)
+        value = 0
+        for m in output:
+            value = value * 10 + table[m]
+        display(f"{value:0{len(output)}}")
+        count += value
     return count
 
 
-def find_edges_by_unique_counts(digits: list[str]) -> str:
-    key = '.' * 7
-    counts_and_edges = Counter("".join(digits).replace(' ', '')).most_common()
-    known_unique_counts = [(0, 5), (-2, 1), (-1, 4)]
-    for counter_idx, key_idx in known_unique_counts:
-        char = counts_and_edges[counter_idx][0]
-        key = str_replace_at_index(key, key_idx, char)
-    return key
-
-
-def find_edges_by_digit_length(digits: list[str], key: str) -> str:
-    easy = [x for x in digits if len(x) in [2, 3, 4, 7]]
-    lengths_and_edges = [(2, 2), (3, 0), (4, 3), (7, 6)]
-    for length, key_idx in lengths_and_edges:
-        char = (set(get_item_by_length(easy, length)) - set(key)).pop()
-        key = str_replace_at_index(key, key_idx, char)
-    return key
+def get_decoding_table(patterns: list[int]) -> list[int]:
+    """
+    Work out which digit each scrambled pattern of a display shows.
+    :param patterns: The masks of the ten unique patterns of the display
+    :return: A table from every possible 7-bit mask to its digit, -1 for masks that aren't one of the patterns
 
-
-def get_item_by_length(items: list[str], length: int) -> str:
-    for i in items:
-        if len(i) == length:
-            return i
-    return ""
+    >>> patterns = "acedgfb cdfbe gcdfa fbcad dab cefabd cdfgeb eafb cagedb ab"
+    >>> table = get_decoding_table([*map(to_mask, patterns.split())])
+    >>> [table[to_mask(o)] for o in "cdfeb fcadb cdfeb cdbaf".split()]
+    [5, 3, 5, 3]
+    """
+    one = next(m for m in patterns if m.bit_count() == 2)
+    four = next(m for m in patterns if m.bit_count() == 4)
+    table = [-1] * 128
+    for m in patterns:
+        table[m] = SHAPES[m.bit_count(), (m & four).bit_count(), (m & one).bit_count()]
+    return table
 
 
 def str_replace_at_index(string: str, i: int, c: str) -> str:
@@ -133,16 +90,7 @@ def str_replace_at_index(string: str, i: int, c: str) -> str:
     return "".join(arr)
 
 
-def decode(digit: str, key: str) -> int:
-    normal_edges = normal_digits[8]
-    answer = ""
-    for c in digit:
-        i = key.index(c)
-        answer += normal_edges[i]
-    answer = "".join(sorted(answer))
-    return normal_digits.index(answer)
-
-
+@visual
 def display(number: str):
     grid = []
     for c in number:
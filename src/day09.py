@@ -1,23 +1,21 @@
 #!/usr/bin/env python3
-# noinspection PyUnresolvedReferences
-from aocd import data, submit
-from collections import namedtuple
-import itertools
+from puzzle_input import get_data
+from rendering import visual
+from grid import Grid
 import operator
 from functools import reduce
 
 # --- Day 9: Smoke Basin ---
 
 
-flatten = itertools.chain.from_iterable
-
-Point = namedtuple("Point", ["row", "col", "height"])
-Row = list[Point]
+Point = int  # index of a cell in the floor grid
 Basin = set[Point]
-Floor = list[Row]
+Floor = Grid
+wall = 10  # the border around the floor is higher than any point on it
 
 
 def main():
+    data = get_data(9)
     ex1 = solve1(example)
     assert ex1 == 15, f"expected 15, but got {ex1}"
     answer1 = solve1(data)
@@ -29,21 +27,15 @@ def main():
 
 
 def process_inputs(inputs: str) -> Floor:
-    rows_of_ints = [[int(y) for y in x] for x in inputs.split('\n')]
-    output = Floor()
-    for i, row in enumerate(rows_of_ints):
-        points_row = Row()
-        for j, height in enumerate(row):
-            points_row.append(Point(i, j, height))
-        output.append(points_row)
-    display(output)
-    return output
+    cave_floor = Grid.from_digits(inputs, border=wall)
+    display(cave_floor)
+    return cave_floor
 
 
 def solve1(inputs: str) -> int:
     cave_floor = process_inputs(inputs)
     low_points = find_low_points(cave_floor)
-    risk_level = reduce(operator.add, [p.height for p in low_points], len(low_points))
+    risk_level = reduce(operator.add, [cave_floor.cells[p] for p in low_points], len(low_points))
     return risk_level
 
 
@@ -56,61 +48,41 @@ def solve2(inputs: str) -> int:
 
 def find_basins(cave_floor: Floor) -> list[Basin]:
     low_points = find_low_points(cave_floor)
-    high_points = find_high_points(cave_floor)
-    basin_points = set(flatten(cave_floor)) - high_points
-    basins = [find_basin(basin_points, x, cave_floor) for x in low_points]
+    max_height = max(max(row) for row in cave_floor.rows())
+    basins = [find_basin(x, cave_floor, max_height) for x in low_points]
     return basins
 
 
-def find_low_points(cave_floor: Floor) -> set[Point]:
-    low_points = set()
-    for row in cave_floor:
-        for point in row:
-            neighbors = get_neighbors(point, cave_floor)
-            if is_low_point(point, neighbors):
-                low_points.add(point)
-                # print(point)
-    return low_points
-
-
-def find_high_points(cave_floor: Floor) -> set[Point]:
-    max_height = max({p.height for p in flatten(cave_floor)})
-    return {p for p in flatten(cave_floor) if p.height == max_height}
-
-
-def find_basin(basin_points: set[Point], point: Point, cave_floor: Floor) -> Basin:
-    unexplored, explored = {point}, Basin()
-    while unexplored - explored:
-        p = (unexplored - explored).pop()
-        neighbors = {n for n in get_neighbors(p, cave_floor) if n in basin_points}
-        unexplored.update({n for n in neighbors if n not in explored})
-        explored.add(p)
-    # print(explored)
+def find_low_points(cave_floor: Floor) -> list[Point]:
+    heights, neighbors = cave_floor.cells, cave_floor.orthogonal
+    return [p for p in cave_floor.indices() if is_low_point(p, heights, neighbors)]
+
+
+def find_basin(point: Point, cave_floor: Floor, max_height: int) -> Basin:
+    """
+    Flood fill from the given point over everything lower than the highest points on the floor.
+    """
+    heights, neighbors = cave_floor.cells, cave_floor.orthogonal
+    unexplored, explored = [point], {point}
+    while unexplored:
+        p = unexplored.pop()
+        for offset in neighbors:
+            n = p + offset
+            if heights[n] < max_height and n not in explored:
+                explored.add(n)
+                unexplored.append(n)
     return explored
 
 
-def is_low_point(point: Point, neighbors: iter) -> bool:
-    return all(map(lambda x: point.height < x.height, neighbors))
-
-
-def get_neighbors(point: Point, cave_floor: Floor) -> set[Point]:
-    max_row = len(cave_floor)
-    max_col = len(cave_floor[0])
-    neighbors = [(point.row - 1, point.col), (point.row + 1, point.col),
-                 (point.row, point.col - 1), (point.row, point.col + 1)]
-    return {cave_floor[r][c]
-            for r, c in neighbors
-            if 0 <= r < max_row and 0 <= c < max_col}
+def is_low_point(point: Point, heights: bytearray, neighbors: tuple[int, ...]) -> bool:
+    height = heights[point]
+    return all(height < heights[point + offset] for offset in neighbors)
 
 
+@visual
 def display(cave_floor: Floor):
-    rows, cols = len(cave_floor), len(cave_floor[0])
-    canvas = [['.' for i in range(cols)] for j in range(rows)]
-    for row in cave_floor:
-        for point in row:
-            canvas[point.row][point.col] = draw(point.height)
-    for line in canvas:
-        print("".join(line))
+    for row in cave_floor.rows():
+        print("".join(draw(height) for height in row))
 
 
 def draw(i: int) -> str:
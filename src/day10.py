@@ -1,17 +1,15 @@
 #!/usr/bin/env python3
 import operator
 from dataclasses import dataclass
-from functools import reduce
-from typing import Iterable
-from colorama import Fore, Style, init
+from functools import cache, reduce
+from collections.abc import Iterable
 
-# noinspection PyUnresolvedReferences
-from aocd import data, submit
+from puzzle_input import get_data
+from rendering import visual
 
 # --- Day 10: Syntax Scoring ---
 
 Stack = list[str]
-init(autoreset=True)  # init colorama
 
 
 @dataclass
@@ -36,6 +34,7 @@ class SyntaxCheckResult:
         return self.corrupt_char > -1
 
     def display(self) -> str:
+        Fore, Style = colorama()
         padding = 140
         if not self.is_corrupted():
             return Style.BRIGHT + Fore.WHITE + (self.line + Fore.GREEN + "".join(self.autocomplete)).ljust(padding) \
@@ -48,6 +47,7 @@ class SyntaxCheckResult:
 
 
 def main():
+    data = get_data(10)
     ex1 = solve1(example)
     assert ex1 == 26397, f"expected 26397, but got {ex1}"
     answer1 = solve1(data)
@@ -91,7 +91,7 @@ def check_syntax(line: str) -> SyntaxCheckResult:
 def get_autocomplete_score(results: Iterable[SyntaxCheckResult]) -> int:
     all_scores = []
     for r in results:
-        print(r.display())
+        show(r)
         all_scores.append(r.get_autocomplete_score())
     all_scores = [s for s in all_scores if s > 0]
     all_scores.sort()
@@ -99,6 +99,21 @@ def get_autocomplete_score(results: Iterable[SyntaxCheckResult]) -> int:
     return all_scores[middle]
 
 
+@visual
+def show(result: SyntaxCheckResult):
+    print(result.display())
+
+
+@cache
+def colorama():
+    """
+    Import and initialise colorama when something is displayed for the first time, so the solver doesn't need it.
+    """
+    import colorama
+    colorama.init(autoreset=True)
+    return colorama.Fore, colorama.Style
+
+
 chars = {
     '(': ')',
     '[': ']',
@@ -1,13 +1,14 @@
 #!/usr/bin/env python3
-# noinspection PyUnresolvedReferences
 from collections import defaultdict
 
-from aocd import data, submit
+from puzzle_input import get_data
+from rendering import visual
 
 # --- Day 12: Passage Pathing ---
 
 
 def main():
+    data = get_data(12)
     ex1a = len(get_paths(example1))
     assert ex1a == 10, f"expected 10, but got {ex1a}"
     ex2a = len(get_paths(example2))
@@ -78,6 +79,7 @@ def get_connections(inputs: str) -> dict[str, set[str]]:
     return connections
 
 
+@visual
 def display(paths: list[str]):
     print("\n".join(paths))
 
@@ -1,11 +1,15 @@
 #!/usr/bin/env python3
-# noinspection PyUnresolvedReferences
-from aocd import data, submit
+from puzzle_input import get_data
+from rendering import echo, visual
+from grid import Grid
 
 # --- Day 13: Transparent Origami ---
 
+Paper = Grid  # one byte per position, 1 for a dot
+
 
 def main():
+    data = get_data(13)
     ex1, letter = solve(example)
     assert ex1 == 17, f"expected 17, but got {ex1}"
     assert letter == 'O', f"expected 'O', but got {letter}"
@@ -20,52 +24,60 @@ def solve(inputs: str):
     for x, i in instructions:
         paper = fold(paper, i, x)
         if answer == 0:
-            answer = sum([sum(r) for r in paper])
+            answer = sum(paper.cells)
     return answer, print_letters(paper)
 
 
-def print_letters(paper: list[list[bool]]) -> str:
+def print_letters(paper: Paper) -> str:
     display(paper)
     font_width = 4
     found_letters = []
-    for n in range(0, len(paper[0]), font_width+1):
+    for n in range(0, paper.width, font_width+1):
         key = ""
-        for row in paper:
+        for row in paper.rows():
             letter = row[n:n+font_width+1]
             key += str(sum(letter))
         found_letters.append(letters[key])
     found_string = "".join(found_letters)
-    print(found_string)
+    echo(found_string)
     return found_string
 
 
-def fold(paper: list[list[bool]], i: int, fold_along: str) -> list[list[bool]]:
-    if fold_along == 'y':
-        paper = transpose(paper)
-    folded = [[n or m for n, m in zip(row[:i], row[:i:-1])] for row in paper]
+def fold(paper: Paper, i: int, fold_along: str) -> Paper:
+    rows = paper.rows()
     if fold_along == 'y':
-        folded = transpose(folded)
-    return folded
+        folded = [overlay(top, bottom) for top, bottom in zip(rows[:i], rows[:i:-1])]
+    else:
+        folded = [overlay(row[:i], row[:i:-1]) for row in rows]
+    return Grid.from_rows(folded, padding=0)
+
 
+def overlay(a: bytes, b: bytes) -> bytes:
+    """
+    Combine the dots of two rows, cut to the shortest one.
 
-def transpose(a: list[list[bool]]) -> list[list[bool]]:
-    return list(map(list, zip(*a)))
+    >>> overlay(bytes([1, 0, 0]), bytes([0, 0, 1, 1]))
+    b'\\x01\\x00\\x01'
+    """
+    n = min(len(a), len(b))
+    return (int.from_bytes(a[:n], 'big') | int.from_bytes(b[:n], 'big')).to_bytes(n, 'big')
 
 
-def read_input(inputs: str) -> (list[list[bool]], list[(str, int)]):
+def read_input(inputs: str) -> (Paper, list[(str, int)]):
     [coords, folding] = inputs.split('\n\n')
     lines = [line for line in coords.split('\n')]
     xs, ys = ([int(line.split(',')[0]) for line in lines], [int(line.split(',')[1]) for line in lines])
-    dots = [[False for x in range(max(xs)+1)] for y in range(max(ys)+1)]
+    dots = Paper(max(xs)+1, max(ys)+1, padding=0)
     for x, y in zip(xs, ys):
-        dots[y][x] = True
+        dots[y, x] = 1
     folds = [(f[11], int(f[13:])) for f in folding.split('\n')]
     return dots, folds
 
 
-def display(matrix: list[list[bool]]):
+@visual
+def display(matrix: Paper):
     builder = []
-    for row in matrix:
+    for row in matrix.rows():
         builder.append("".join(["\u2588\u2588" if x else "  " for x in row]))
     print("\n".join(builder))
 
@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
-# noinspection PyUnresolvedReferences
-from aocd import data, submit
+from puzzle_input import get_data
+from rendering import clear, visual
 from collections import Counter
 from itertools import pairwise
 
@@ -10,6 +10,7 @@ PolymerRules = dict[tuple[str, str], str]
 
 
 def main():
+    data = get_data(14)
     ex1 = solve(example, 10)
     assert ex1 == 1588, f"expected 1588, but got {ex1}"
     answer1 = solve(data, 10)
@@ -48,6 +49,7 @@ def read_inputs(inputs: str) -> (str, PolymerRules):
     return lines[0], rules
 
 
+@visual
 def display(polymers: Counter, i):
     clear()
     print(f"Step {i}")
@@ -58,13 +60,6 @@ def display(polymers: Counter, i):
     print('\n')
 
 
-def clear():
-    from time import sleep
-    import os
-    sleep(0.05)
-    os.system('cls' if os.name == 'nt' else 'clear')
-
-
 example = """
 NNCB
 
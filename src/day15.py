@@ -1,14 +1,17 @@
 #!/usr/bin/env python3
 import heapq
-# noinspection PyUnresolvedReferences
-from aocd import data, submit
+from puzzle_input import get_data
+from rendering import echo, visual
+from grid import Grid
 
 # --- Day 15: Chiton ---
 
-Graph = dict[(int, int), dict[(int, int), int]]
+Node = int  # index of a position in the cave grid
+Cave = Grid  # risk level per position; the border is 0 and can't be entered
 
 
 def main():
+    data = get_data(15)
     ex1 = solve(example)
     assert ex1 == 40, f"expected 40, but got {ex1}"
     answer1 = solve(data)
@@ -20,24 +23,31 @@ def main():
 
 
 def solve(inputs: str, multiply: int = 1) -> int:
-    graph, values = read_inputs(inputs, multiply)
-    bottom_right = (len(values) - 1, len(values[9]) - 1)
-    # nodes, shortest_paths = astar(graph, (0, 0), bottom_right)
-    nodes, shortest_paths = dijkstra(graph, (0, 0))
+    cave = read_inputs(inputs, multiply)
+    top_left, bottom_right = cave.index(0, 0), cave.index(cave.height - 1, cave.width - 1)
+    # nodes, shortest_paths = astar(cave, top_left, bottom_right)
+    nodes, shortest_paths = dijkstra(cave, top_left)
     answer = shortest_paths[bottom_right]
-    draw_path((0, 0), bottom_right, nodes, values)
-    print(f"Path cost: {answer}")
+    draw_path(top_left, bottom_right, nodes, cave)
+    echo(f"Path cost: {answer}")
     return answer
 
 
-def dijkstra(graph: Graph, start: (int, int)):
-    distances = {node: float('inf') for node in graph}
+def dijkstra(cave: Cave, start: Node) -> (list[Node], list[int]):
+    risk = cave.cells
+    distances = [float('inf')] * len(risk)
     distances[start] = 0
-    came_from = {node: None for node in graph}
+    came_from = [None] * len(risk)
     queue = [(0, start)]
     while queue:
         current_distance, current_node = heapq.heappop(queue)
-        for next_node, weight in graph[current_node].items():
+        if current_distance > distances[current_node]:
+            continue  # already reached along a shorter path
+        for offset in cave.orthogonal:
+            next_node = current_node + offset
+            weight = risk[next_node]
+            if not weight:
+                continue
             distance_temp = current_distance + weight
             if distance_temp < distances[next_node]:
                 distances[next_node] = distance_temp
@@ -46,81 +56,62 @@ def dijkstra(graph: Graph, start: (int, int)):
     return came_from, distances
 
 
-def astar(og_graph: Graph, start: (int, int), end: (int, int)) -> (dict[(int, int), (int, int)], dict[(int, int), int]):
-    def create_graph(g: Graph, e: (int, int)) -> dict[(int, int), dict[(int, int), [int, int]]]:
-        nodes = g.keys()
-        result = {}
-        for n in nodes:
-            result[n] = {m: [w, mh_distance(*m, *e)] for m, w in g[n].items()}
-        return result
+def astar(cave: Cave, start: Node, end: Node) -> (list[Node], list[int]):
+    def mh_distance(node: Node) -> int:
+        r, c = cave.position(node)
+        return abs(r - end_row) + abs(c - end_col)
 
-    def mh_distance(p1, p2, q1, q2):
-        return abs(p1 - q1) + abs(p2 - q2)
-
-    graph = create_graph(og_graph, end)
-    f_distance = {node: float('inf') for node in graph}
+    end_row, end_col = cave.position(end)
+    risk = cave.cells
+    f_distance = [float('inf')] * len(risk)
     f_distance[start] = 0
-    g_distance = {node: float('inf') for node in graph}
+    g_distance = [float('inf')] * len(risk)
     g_distance[start] = 0
-    came_from = {node: None for node in graph}
+    came_from = [None] * len(risk)
     came_from[start] = start
     queue = [(0, start)]
     while queue:
         current_f_distance, current_node = heapq.heappop(queue)
         if current_node == end:
             return came_from, f_distance
-        for next_node, weights in graph[current_node].items():
-            temp_g_distance = g_distance[current_node] + weights[0]
+        for offset in cave.orthogonal:
+            next_node = current_node + offset
+            if not risk[next_node]:
+                continue
+            temp_g_distance = g_distance[current_node] + risk[next_node]
             if temp_g_distance < g_distance[next_node]:
                 g_distance[next_node] = temp_g_distance
-                heuristic = weights[1]
-                f_distance[next_node] = temp_g_distance + heuristic
+                f_distance[next_node] = temp_g_distance + mh_distance(next_node)
                 came_from[next_node] = current_node
                 heapq.heappush(queue, (f_distance[next_node], next_node))
     return came_from, f_distance
 
 
-def get_neighbors(r: int, c: int, num_rows: int, num_cols: int) -> set[tuple[int, int]]:
-    neighbors = {(r + x, c) for x in {-1, 1}} | {(r, c + x) for x in {-1, 1}}
-    return {(n, m) for n, m in neighbors if 0 <= n < num_rows and 0 <= m < num_cols}
-
-
-def read_inputs(inputs: str, multiply: int) -> (Graph, list[list[int]]):
-    nums_file = [[int(x) for x in line] for line in inputs.split('\n')]
-    num_rows = len(nums_file)
-    num_cols = len(nums_file[0])
-    nums = [[-1 for x in range(num_rows * multiply)] for y in range(num_cols * multiply)]
-    for r, row in enumerate(nums_file):
-        for c, val in enumerate(row):
-            for m in range(0, multiply):
-                for n in range(0, multiply):
-                    nums[r + (num_rows * m)][c + (num_cols * n)] = ((val - 1 + 1 * m + 1 * n) % 9) + 1
-    graph = Graph()
-    for r, row in enumerate(nums):
-        for c, _ in enumerate(row):
-            graph[(r, c)] = {(i, j): nums[i][j]
-                             for (i, j) in get_neighbors(r, c, num_rows * multiply, num_cols * multiply)}
-    return graph, nums
-
-
-def draw_path(start: (int, int),
-              end: (int, int),
-              previous_nodes: dict[(int, int), (int, int)],
-              grid: list[list[int]]):
+def read_inputs(inputs: str, multiply: int) -> Cave:
+    tile = [[int(x) for x in line] for line in inputs.split('\n')]
+    rows = [bytes(((val - 1 + m + n) % 9) + 1 for n in range(multiply) for val in row)
+            for m in range(multiply)
+            for row in tile]
+    return Grid.from_rows(rows)
+
+
+@visual
+def draw_path(start: Node,
+              end: Node,
+              previous_nodes: list[Node],
+              cave: Cave):
     c_red = '\033[91m'
     c_end = '\033[0m'
-    path = [end]
+    path = {end}
     node = end
-    while node is not start:
+    while node != start:
         node = previous_nodes[node]
-        path.append(node)
-        if node == start:
-            break
+        path.add(node)
     matrix = ""
-    for r, row in enumerate(grid):
+    for r, row in enumerate(cave.rows()):
         row_string = ""
         for c, cell in enumerate(row):
-            if (r, c) in path:
+            if cave.index(r, c) in path:
                 row_string += c_red + str(cell) + c_end
             else:
                 row_string += str(cell)
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 import operator
 from functools import reduce
-from aocd import data, submit
+from puzzle_input import get_data
 
 # --- Day 16: Packet Decoder ---
 
@@ -18,6 +18,7 @@ Operators = {
 
 
 def main():
+    data = get_data(16)
     for ex in examples1:
         ex1 = get_version_sum(ex[0])
         assert ex1 == ex[1], f"expected {ex[1]}, but got {ex1}"
@@ -1,11 +1,12 @@
 #!/usr/bin/env python3
-import re
-from aocd import data, submit
+from puzzle_input import get_data
+from rendering import clear, visual
 
 # --- Day 17: Trick Shot ---
 
 
 def main():
+    data = get_data(17)
     ex1, ex2 = solve(example)
     assert ex1 == 45, f"expected 45, but got {ex1}"
     assert ex2 == 112, f"expected 112, but got {ex2}"
@@ -15,6 +16,7 @@ def main():
 
 
 def solve(inputs: str) -> (int, int):
+    import re
     bounds = [int(s) for s in re.findall(r'-?\d+', inputs)]
     highest_y = 0
     best_trajectory = None
@@ -58,6 +60,7 @@ def hit_target(x: int, y: int, bounds: list[int]) -> bool:
     return bounds[0] <= x <= bounds[1] and bounds[2] <= y <= bounds[3]
 
 
+@visual
 def display(trajectory: list[tuple[int, int]], target_bounds):
     clear()
     points = [(target_bounds[0], target_bounds[2]), (target_bounds[1], target_bounds[3])]
@@ -76,13 +79,6 @@ def display(trajectory: list[tuple[int, int]], target_bounds):
     grid.print()
 
 
-def clear():
-    from time import sleep
-    import os
-    sleep(0.05)
-    os.system('cls' if os.name == 'nt' else 'clear')
-
-
 class Grid:
     y_0 = 0
     min_y = 0
@@ -1,15 +1,15 @@
 #!/usr/bin/env python3
-import re
 from functools import reduce
 from itertools import permutations
 from math import ceil
 
-from aocd import data, submit
+from puzzle_input import get_data
 
 # --- Day 18: Snailfish ---
 
 
 def main():
+    data = get_data(18)
     ex1, _ = mag_finalsum(example)
     assert ex1 == 4140, f"expected 4140, but got {ex1}"
     answer1, sfnum = mag_finalsum(data)
@@ -335,6 +335,7 @@ def read_number(numbers: str) -> tuple:
     >>> read_number("[[1000,198],[223,378]]")
     ((1000, 198), (223, 378))
     """
+    import re
     assert numbers[0] == "["
     assert numbers[-1] == "]"
     stack = []
@@ -1,11 +1,7 @@
 #!/usr/bin/env python3
-import copy
-import re
 from dataclasses import dataclass
 from math import sqrt
 
-from aocd import data, submit
-
 # --- Day 19: Beacon scanner ---
 
 
@@ -148,6 +144,7 @@ class Scanner:
         self.position: Point = None
         self.network: set[Scanner] = {self}
         lines = report.split('\n')
+        import re
         n = re.findall(r'(\d+)', lines[0])
         self.id = int(n[0])
         for line in lines[1:]:
@@ -186,6 +183,7 @@ class Scanner:
             b.normalize_position(self.position)
 
     def get_beacons(self) -> list[Beacon]:
+        import copy
         return copy.deepcopy(self.beacons)
 
 
@@ -1,19 +1,17 @@
 #!/usr/bin/env python3
-import itertools
-from typing import Literal
-
-from aocd import data, submit
+from puzzle_input import get_data
+from rendering import echo, visual
+from grid import Grid
 
 # --- Day 20: Trench map ---
 
-flatten = itertools.chain.from_iterable
-
 Pixel = int
 EnhancementAlgorithm = list[Pixel]
-Image = list[list[Pixel]]
+Image = Grid  # one byte per pixel; the border holds the pixel of the infinite background
 
 
 def main():
+    data = get_data(20)
     ex1 = enhance(example, 2)
     assert ex1 == 35, f"expected 35, but got {ex1}"
     answer1 = enhance(data, 2)
@@ -34,51 +32,41 @@ def enhance(inputs: str, repeats: int) -> int:
     default_pixel = 0
     display(image)
     for i in range(repeats):
-        print(i)
-        image = enhance_image(image, image_enhancement_algorithm, default_pixel)
+        echo(i)
+        image = enhance_image(image, image_enhancement_algorithm)
         if default_pixel == 0 and image_enhancement_algorithm[0] == 1:
             default_pixel = 1
         elif default_pixel == 1 and image_enhancement_algorithm[-1] == 0:
             default_pixel = 0
+        image.fill_border(default_pixel)
     display(image)
-    return sum(flatten(image))
-
-
-def enhance_image(image: Image, image_enhancement_algorithm: EnhancementAlgorithm, default_pixel: Pixel) -> Image:
-    enhanced_image = [[0 for r in range(len(image))] for c in range(len(image[0]))]
-    for i, row in enumerate(enhanced_image):
-        for j, _ in enumerate(row):
-            surrounding = get_surrounding_pixels(i, j, image, default_pixel)
-            idx = int("".join([str(p) for p in surrounding]), 2)
-            if image_enhancement_algorithm[idx] == 1:
-                enhanced_image[i][j] = 1
+    return sum(sum(row) for row in image.rows())
+
+
+def enhance_image(image: Image, image_enhancement_algorithm: EnhancementAlgorithm) -> Image:
+    enhanced_image = Grid(image.width, image.height)
+    pixels, enhanced_pixels = image.cells, enhanced_image.cells
+    surrounding = image.block
+    for i in image.indices():
+        idx = 0
+        for offset in surrounding:
+            idx = idx << 1 | pixels[i + offset]
+        enhanced_pixels[i] = image_enhancement_algorithm[idx]
     return enhanced_image
 
 
-def get_surrounding_pixels(i: int, j: int, img: Image, d: Pixel) -> list[Pixel]:
-    return [get_pixel(i - 1, j - 1, img, d), get_pixel(i - 1, j, img, d), get_pixel(i - 1, j + 1, img, d),
-            get_pixel(i,     j - 1, img, d), get_pixel(i,     j, img, d), get_pixel(i,     j + 1, img, d),
-            get_pixel(i + 1, j - 1, img, d), get_pixel(i + 1, j, img, d), get_pixel(i + 1, j + 1, img, d)]
-
-
-def get_pixel(i: int, j: int, image: Image, default_pixel: Pixel) -> Pixel:
-    if 0 <= i < len(image) and 0 <= j < len(image[0]):
-        return image[i][j]
-    else:
-        return default_pixel
-
-
 def create_image(inputs: str, padding: int) -> Image:
-    image: Image = [[0] * padding + [1 if x == "#" else 0 for x in line] + padding * [0] for line in inputs.split()]
-    for i in range(padding):
-        image.insert(0, len(image[0]) * [0])
-    for j in range(padding):
-        image.append(len(image[0]) * [0])
-    return image
+    lines = inputs.split()
+    width = len(lines[0]) + 2 * padding
+    rows = [bytes(width)] * padding
+    rows += [bytes(padding) + bytes(1 if x == "#" else 0 for x in line) + bytes(padding) for line in lines]
+    rows += [bytes(width)] * padding
+    return Grid.from_rows(rows)
 
 
+@visual
 def display(image: Image):
-    for line in image:
+    for line in image.rows():
         print("".join(["#" if x == 1 else "." for x in line]))
     print()
 
@@ -1,11 +1,9 @@
 #!/usr/bin/env python3
-import copy
-import itertools
-import re
 from collections import Counter
 from dataclasses import dataclass
 
-from aocd import data, submit
+from puzzle_input import get_data
+from rendering import echo
 
 # --- Day 21: Dirac Dice ---
 
@@ -53,6 +51,7 @@ class Dicegame:
 
 
 def main():
+    data = get_data(21)
     ex1 = solve(example, OneHunderdSidedDie(0))
     assert ex1 == 739785, f"expected 739785, but got {ex1}"
     answer1 = solve(data, OneHunderdSidedDie(0))
@@ -68,6 +67,7 @@ def solve(inputs: str, die) -> int:
     :param die: The die to roll
     :return: losing_score * num_die_rolls
     """
+    import re
     starting_positions = [re.findall(r'\d+', player) for player in inputs.split('\n')]
     players = list(map(lambda x: Player(int(x[0]), int(x[1]), 0), starting_positions))
     if type(die) is OneHunderdSidedDie:
@@ -79,11 +79,11 @@ def solve(inputs: str, die) -> int:
 
 
 def play_dirac(game: Dicegame, universe_count: int) -> Counter:
-    print(str(universe_count))
+    echo(universe_count)
     universes = Counter({p.id: 0 for p in game.players})
     for player in game.players:
         if player.score >= game.score_limit:
-            print(f"finished universe {universe_count}")
+            echo(f"finished universe {universe_count}")
             universes[player.id] += 1
             game.finished = True
             break
@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+import argparse
+import itertools
+import random
+
+# --- Synthetic puzzle inputs ---
+
+# Every generator takes a size and a seed and returns a valid puzzle input as a string; the same size and seed
+# always produce the same input.
+
+
+def day01(size: int, seed: int = 0) -> str:
+    """
+    :param size: Number of depth readings
+    """
+    rng = random.Random(seed)
+    depth, depths = 100, []
+    for _ in range(size):
+        depth = max(0, depth + rng.randint(-10, 20))
+        depths.append(depth)
+    return "\n".join(map(str, depths))
+
+
+def day02(size: int, seed: int = 0) -> str:
+    """
+    :param size: Number of instructions
+    """
+    rng = random.Random(seed)
+    moves = rng.choices(["forward", "down", "up"], weights=[4, 3, 2], k=size)
+    return "\n".join(f"{move} {rng.randint(1, 9)}" for move in moves)
+
+
+def day03(size: int, seed: int = 0, width: int = 12) -> str:
+    """
+    :param size: Number of diagnostic reports, which are all different
+    :param width: Minimal number of bits per report, widened when it can't hold size different reports
+    """
+    rng = random.Random(seed)
+    width = max(width, size.bit_length())
+    reports = rng.sample(range(2 ** width), size)
+    return "\n".join(f"{r:0{width}b}" for r in reports)
+
+
+def day04(size: int, seed: int = 0, numbers: int = 100) -> str:
+    """
+    :param size: Number of bingo boards
+    :param numbers: Number of distinct numbers that are drawn, all boards win before they run out
+    """
+    rng = random.Random(seed)
+    draws = rng.sample(range(numbers), numbers)
+    boards = []
+    for _ in range(size):
+        board = rng.sample(range(numbers), 25)
+        boards.append("\n".join(" ".join(f"{n:2}" for n in board[r * 5:r * 5 + 5]) for r in range(5)))
+    return ",".join(map(str, draws)) + "\n\n" + "\n\n".join(boards)
+
+
+def day05(size: int, seed: int = 0, extent: int = 1000) -> str:
+    """
+    :param size: Number of vent lines
+    :param extent: Coordinates range from 0 up to extent
+    """
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(size):
+        x1, y1 = rng.randrange(extent), rng.randrange(extent)
+        length = rng.randint(-(extent // 4), extent // 4)
+        match rng.randrange(3):
+            case 0:
+                x2, y2 = min(max(x1 + length, 0), extent - 1), y1
+            case 1:
+                x2, y2 = x1, min(max(y1 + length, 0), extent - 1)
+            case _:
+                dx, dy = rng.choice([-1, 1]), rng.choice([-1, 1])
+                steps = min(abs(length), x1 if dx < 0 else extent - 1 - x1, y1 if dy < 0 else extent - 1 - y1)
+                x2, y2 = x1 + dx * steps, y1 + dy * steps
+        lines.append(f"{x1},{y1} -> {x2},{y2}")
+    return "\n".join(lines)
+
+
+def day06(size: int, seed: int = 0) -> str:
+    """
+    :param size: Number of lanternfish
+    """
+    rng = random.Random(seed)
+    return ",".join(str(rng.randint(1, 5)) for _ in range(size))
+
+
+def day07(size: int, seed: int = 0, extent: int = 2000) -> str:
+    """
+    :param size: Number of crabs
+    :param extent: Positions range from 0 up to extent
+    """
+    rng = random.Random(seed)
+    return ",".join(str(rng.randrange(extent)) for _ in range(size))
+
+
+seven_segment_digits = ["abcefg", "cf", "acdeg", "acdfg", "bcdf", "abdfg", "abdefg", "acf", "abcdefg", "abcdfg"]
+
+
+def day08(size: int, seed: int = 0) -> str:
+    """
+    :param size: Number of displays, each with its own wiring
+    """
+    rng = random.Random(seed)
+    displays = []
+    for _ in range(size):
+        wiring = dict(zip("abcdefg", rng.sample("abcdefg", 7)))
+        patterns = ["".join(rng.sample([wiring[c] for c in digit], len(digit))) for digit in seven_segment_digits]
+        signals = rng.sample(patterns, 10)
+        output = ["".join(rng.sample(p, len(p))) for p in rng.choices(patterns, k=4)]
+        displays.append(" ".join(signals) + " | " + " ".join(output))
+    return "\n".join(displays)
+
+
+def day09(size: int, seed: int = 0) -> str:
+    """
+    :param size: Width and height of the heightmap
+    """
+    return digit_grid(size, seed, "0123456789")
+
+
+def day10(size: int, seed: int = 0, length: int = 100) -> str:
+    """
+    :param size: Number of lines, each one either corrupted or incomplete
+    :param length: Maximal number of characters per line
+    """
+    rng = random.Random(seed)
+    pairs = {'(': ')', '[': ']', '{': '}', '<': '>'}
+    lines = []
+    for _ in range(size):
+        stack, line = [], []
+        corrupted = rng.random() < 0.5
+        for _ in range(rng.randint(length // 2, length)):
+            if stack and rng.random() < 0.4:
+                line.append(pairs[stack.pop()])
+            else:
+                stack.append(rng.choice("([{<"))
+                line.append(stack[-1])
+        if not stack:
+            line.append(rng.choice("([{<"))
+            stack.append(line[-1])
+        if corrupted:
+            line.append(rng.choice([c for c in pairs.values() if c != pairs[stack[-1]]]))
+        lines.append("".join(line))
+    return "\n".join(lines)
+
+
+def day11(size: int, seed: int = 0) -> str:
+    """
+    :param size: Width and height of the octopus grid
+    """
+    return digit_grid(size, seed, "0123456789")
+
+
+def day12(size: int, seed: int = 0, big_caves: int = 2) -> str:
+    """
+    :param size: Number of small caves besides start and end; the number of paths grows exponentially with it
+    :param big_caves: Number of big caves, which are never connected to each other
+    """
+    rng = random.Random(seed)
+    small = [f"c{i}" for i in range(size)]
+    big = [f"B{i}" for i in range(big_caves)]
+    connections = {("start", rng.choice(small + big)), (rng.choice(small + big), "end")}
+    for cave in small:
+        connections.add((cave, rng.choice(small + big + ["end"])))
+    for cave in big:
+        for other in rng.sample(small, min(3, size)):
+            connections.add((cave, other))
+    return "\n".join(f"{a}-{b}" for a, b in sorted(connections) if a != b)
+
+
+font = {
+    'B': ["###.", "#..#", "###.", "#..#", "#..#", "###."],
+    'C': [".##.", "#..#", "#...", "#...", "#..#", ".##."],
+    'E': ["####", "#...", "###.", "#...", "#...", "####"],
+    'G': [".##.", "#..#", "#...", "#.##", "#..#", ".###"],
+    'L': ["#...", "#...", "#...", "#...", "#...", "####"],
+    'P': ["###.", "#..#", "#..#", "###.", "#...", "#..."],
+    'R': ["###.", "#..#", "#..#", "###.", "#.#.", "#..#"],
+}
+
+
+def day13(size: int, seed: int = 0, letters: int = 8) -> str:
+    """
+    Write random letters on a tiny paper and unfold it size times, alternating between unfolding along x and y.
+    :param size: Number of fold instructions
+    :param letters: Number of letters that appear after the last fold
+
+    >>> import day13 as puzzle
+    >>> [puzzle.solve(day13(size, seed=18))[1] for size in (5, 6)]
+    ['CLECGGGG', 'CLECGGGG']
+    """
+    rng = random.Random(seed)
+    text = rng.choices(list(font), k=letters)
+    dots = {(i * 5 + x, y) for i, letter in enumerate(text)
+            for y, row in enumerate(font[letter])
+            for x, pixel in enumerate(row) if pixel == '#'}
+    width, height = letters * 5, 6
+    folds = []
+    for n in range(size):
+        axis = 'x' if n % 2 == 0 else 'y'
+        fold_line = width if axis == 'x' else height
+        # the paper size is read from the outermost dots, so one dot on the edge at 0 is kept on both halves, which
+        # puts dots on both edges of the unfolded paper; that dot then stays on the edge in all later unfolds
+        edge = min(dots, key=lambda p: p[0] if axis == 'x' else p[1])
+        unfolded = set()
+        for x, y in dots:
+            mirrored = (2 * fold_line - x, y) if axis == 'x' else (x, 2 * fold_line - y)
+            choices = [[(x, y), mirrored]] if (x, y) == edge else [[(x, y)], [mirrored], [(x, y), mirrored]]
+            unfolded.update(rng.choice(choices))
+        if axis == 'x':
+            width = 2 * width + 1
+        else:
+            height = 2 * height + 1
+        dots = unfolded
+        folds.append(f"fold along {axis}={fold_line}")
+    coordinates = "\n".join(f"{x},{y}" for x, y in rng.sample(sorted(dots), len(dots)))
+    return coordinates + "\n\n" + "\n".join(reversed(folds))
+
+
+def day14(size: int, seed: int = 0, elements: str = "BCFHKNOPSV") -> str:
+    """
+    :param size: Length of the polymer template
+    :param elements: The elements that appear in the template and the rules
+    """
+    rng = random.Random(seed)
+    template = "".join(rng.choices(elements, k=max(2, size)))
+    rules = [f"{a}{b} -> {rng.choice(elements)}" for a, b in itertools.product(elements, repeat=2)]
+    return template + "\n\n" + "\n".join(rules)
+
+
+def day15(size: int, seed: int = 0) -> str:
+    """
+    :param size: Width and height of the risk level map
+    """
+    return digit_grid(size, seed, "123456789")
+
+
+def day16(size: int, seed: int = 0) -> str:
+    """
+    :param size: Depth of the packet tree
+    """
+    rng = random.Random(seed)
+    bits = encode_packet(rng, size)
+    bits += "0" * (-len(bits) % 4)
+    return "".join(f"{int(bits[i:i + 4], 2):X}" for i in range(0, len(bits), 4))
+
+
+def encode_packet(rng: random.Random, depth: int) -> str:
+    version = f"{rng.randrange(8):03b}"
+    if depth == 0:
+        groups = f"{rng.randrange(2 ** 16):016b}"
+        chunks = [groups[i:i + 4] for i in range(0, 16, 4)]
+        return version + "100" + "".join(("1" if i < 3 else "0") + c for i, c in enumerate(chunks))
+    packet_type = rng.choice([0, 1, 2, 3, 5, 6, 7])
+    count = 2 if packet_type >= 5 else rng.randint(1, 3)
+    subpackets = "".join(encode_packet(rng, rng.randint(0, depth - 1) if i else depth - 1) for i in range(count))
+    if len(subpackets) < 2 ** 15 and rng.random() < 0.5:
+        return version + f"{packet_type:03b}" + "0" + f"{len(subpackets):015b}" + subpackets
+    return version + f"{packet_type:03b}" + "1" + f"{count:011b}" + subpackets
+
+
+def day17(size: int, seed: int = 0) -> str:
+    """
+    :param size: Distance between the probe and the far edge of the target area. The solver only tries velocities up
+    to 300 in each direction, so beyond a size of about 300 it misses hits: its answers are wrong, and its time stops
+    growing with the size, so larger sizes are no scaling point.
+
+    >>> [day17(size) for size in (1, 15)]
+    ['target area: x=1..1, y=-1..-1', 'target area: x=7..15, y=-15..-6']
+    """
+    rng = random.Random(seed)
+    x_min = rng.randint(max(1, size // 2), max(1, size - 10, size // 2))
+    y_max = -rng.randint(max(1, size // 4), max(1, size // 2))
+    return f"target area: x={x_min}..{size}, y={-size}..{y_max}"
+
+
+def day18(size: int, seed: int = 0) -> str:
+    """
+    :param size: Number of snailfish numbers, all of them already reduced
+    """
+    rng = random.Random(seed)
+    return "\n".join(snailfish_number(rng, 0) for _ in range(size))
+
+
+def snailfish_number(rng: random.Random, depth: int) -> str:
+    def element() -> str:
+        if depth < 3 and rng.random() < 0.6:
+            return snailfish_number(rng, depth + 1)
+        return str(rng.randrange(10))
+    return f"[{element()},{element()}]"
+
+
+def day19(size: int, seed: int = 0, overlap: int = 12, extra: int = 14) -> str:
+    """
+    Scanners are placed in a chain where every scanner shares a number of beacons with the previous one.
+    :param size: Number of scanners
+    :param overlap: Number of beacons shared by neighbouring scanners
+    :param extra: Number of beacons only seen by each scanner
+    """
+    rng = random.Random(seed)
+    positions = [(0, 0, 0)]
+    for _ in range(size - 1):
+        x, y, z = positions[-1]
+        positions.append((x + rng.randint(-1200, 1200), y + rng.randint(-1200, 1200), z + rng.randint(-1200, 1200)))
+    beacons = set()
+    for a, b in zip(positions, positions[1:]):
+        low = [max(p, q) - 1000 for p, q in zip(a, b)]
+        high = [min(p, q) + 1000 for p, q in zip(a, b)]
+        beacons.update(tuple(rng.randint(lo, hi) for lo, hi in zip(low, high)) for _ in range(overlap))
+    for p in positions:
+        beacons.update(tuple(c + rng.randint(-1000, 1000) for c in p) for _ in range(extra))
+    reports = []
+    for i, p in enumerate(positions):
+        rotation = rotations[0] if i == 0 else rng.choice(rotations)
+        seen = [tuple(b - c for b, c in zip(beacon, p)) for beacon in beacons
+                if all(abs(b - c) <= 1000 for b, c in zip(beacon, p))]
+        lines = [",".join(map(str, rotation(b))) for b in rng.sample(seen, len(seen))]
+        reports.append(f"--- scanner {i} ---\n" + "\n".join(lines))
+    return "\n\n".join(reports)
+
+
+def rotation(axes: tuple, signs: tuple):
+    return lambda p: tuple(p[a] * s for a, s in zip(axes, signs))
+
+
+# The 24 orientations: every permutation of the axes, with signs that keep the determinant at +1
+rotations = [rotation(axes, (sx, sy, sx * sy * parity))
+             for axes, parity in zip(itertools.permutations(range(3)), [1, -1, -1, 1, 1, -1])
+             for sx, sy in itertools.product([1, -1], repeat=2)]
+
+
+def day20(size: int, seed: int = 0) -> str:
+    """
+    :param size: Width and height of the input image
+    """
+    rng = random.Random(seed)
+    algorithm = [rng.choice("#.") for _ in range(512)]
+    if algorithm[0] == '#':
+        algorithm[-1] = '.'  # otherwise the infinite background lights up for good
+    image = ["".join(rng.choices("#.", k=size)) for _ in range(size)]
+    return "".join(algorithm) + "\n\n" + "\n".join(image)
+
+
+def day21(size: int, seed: int = 0) -> str:
+    """
+    :param size: Number of players
+    """
+    rng = random.Random(seed)
+    return "\n".join(f"Player {i} starting position: {rng.randint(1, 10)}" for i in range(1, size + 1))
+
+
+def digit_grid(size: int, seed: int, digits: str) -> str:
+    rng = random.Random(seed)
+    return "\n".join("".join(rng.choices(digits, k=size)) for _ in range(size))
+
+
+GENERATORS = {int(name[3:]): func for name, func in globals().items() if name.startswith("day")}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Print a synthetic puzzle input.")
+    parser.add_argument("day", type=int)
+    parser.add_argument("size", type=int)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    print(GENERATORS[args.day](args.size, args.seed))
+
+
+if __name__ == "__main__":
+    main()
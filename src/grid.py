@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+
+# --- Compact 2D grid shared by the grid puzzles ---
+
+
+class Grid:
+    """
+    A grid of small numbers (0-255) stored row by row in one flat bytearray, one byte per cell. The grid is
+    surrounded by a border of padding cells, so neighbours can be reached by adding one of the precomputed offsets to
+    a cell index without checking bounds first.
+
+    >>> grid = Grid.from_digits("123\\n456")
+    >>> grid.width, grid.height, grid[1, 2]
+    (3, 2, 6)
+    >>> i = grid.index(0, 1)
+    >>> sorted(grid.cells[i + o] for o in grid.orthogonal)
+    [0, 1, 3, 5]
+    >>> grid.position(i + grid.stride)
+    (1, 1)
+    >>> [list(row) for row in grid.rows()]
+    [[1, 2, 3], [4, 5, 6]]
+    """
+    def __init__(self, width: int, height: int, padding: int = 1, border: int = 0):
+        self.width = width
+        self.height = height
+        self.padding = padding
+        self.stride = width + 2 * padding
+        self.cells = bytearray([border]) * (self.stride * (height + 2 * padding))
+        stride = self.stride
+        self.orthogonal = (-stride, -1, 1, stride)
+        self.surrounding = (-stride - 1, -stride, -stride + 1, -1, 1, stride - 1, stride, stride + 1)
+        # the 3x3 block around a cell in reading order, including the cell itself
+        self.block = (-stride - 1, -stride, -stride + 1, -1, 0, 1, stride - 1, stride, stride + 1)
+
+    @classmethod
+    def from_rows(cls, rows: list[bytes], padding: int = 1, border: int = 0):
+        grid = cls(len(rows[0]), len(rows), padding, border)
+        for r, row in enumerate(rows):
+            start = grid.index(r, 0)
+            grid.cells[start:start + grid.width] = row
+        return grid
+
+    @classmethod
+    def from_digits(cls, text: str, padding: int = 1, border: int = 0):
+        return cls.from_rows([bytes(int(c) for c in line) for line in text.split('\n')], padding, border)
+
+    def index(self, row: int, col: int) -> int:
+        return (row + self.padding) * self.stride + col + self.padding
+
+    def position(self, index: int) -> (int, int):
+        row, col = divmod(index, self.stride)
+        return row - self.padding, col - self.padding
+
+    def indices(self):
+        """
+        :return: The indices of all cells inside the border, in reading order
+        """
+        for r in range(self.height):
+            start = self.index(r, 0)
+            yield from range(start, start + self.width)
+
+    def row(self, r: int) -> bytearray:
+        start = self.index(r, 0)
+        return self.cells[start:start + self.width]
+
+    def rows(self) -> list[bytearray]:
+        return [self.row(r) for r in range(self.height)]
+
+    def fill_border(self, value: int):
+        inside = self.rows()
+        self.cells[:] = bytearray([value]) * len(self.cells)
+        for r, row in enumerate(inside):
+            start = self.index(r, 0)
+            self.cells[start:start + self.width] = row
+
+    def copy(self):
+        grid = Grid.__new__(Grid)
+        grid.__dict__.update(self.__dict__)
+        grid.cells = bytearray(self.cells)
+        return grid
+
+    def __getitem__(self, position: (int, int)) -> int:
+        return self.cells[self.index(*position)]
+
+    def __setitem__(self, position: (int, int), value: int):
+        self.cells[self.index(*position)] = value
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+import functools
+import importlib
+import time
+from collections import Counter
+from dataclasses import dataclass
+
+# --- Opt-in profiling of named functions ---
+
+
+@dataclass
+class FunctionStats:
+    calls: int = 0
+    total: float = 0.0  # time spent in the outermost calls, so recursion isn't counted twice
+    own: float = 0.0  # time spent in the function itself, not in other profiled functions
+    active: int = 0
+
+
+class Profiler:
+    """
+    Counts calls and time of functions given by their dotted name (e.g. "day18.sf_explode" or
+    "day19.Scanner.get_beacons") while the profiler is used as a context manager. The functions are replaced by
+    timing wrappers on enter and restored on exit, so there's no cost at all outside the with block.
+
+    >>> import day18
+    >>> with Profiler(["day18.sf_explode", "day18.sf_reduce"]) as profiler:
+    ...     _ = day18.sf_add((1, 2), ((3, 4), 5))
+    >>> profiler.stats["day18.sf_explode"].calls, profiler.stats["day18.sf_reduce"].calls
+    (4, 1)
+    >>> day18.sf_explode.__name__, hasattr(day18.sf_explode, "__wrapped__")
+    ('sf_explode', False)
+    """
+    def __init__(self, targets: list[str]):
+        self.targets = targets
+        self.stats: dict[str, FunctionStats] = {t: FunctionStats() for t in targets}
+        self.stacks: Counter = Counter()
+        self.originals = []
+        self.call_stack: list[str] = []
+        self.child_time: list[float] = []
+
+    def __enter__(self):
+        for target in self.targets:
+            owner, attribute = resolve(target)
+            original = owner.__dict__[attribute]
+            self.originals.append((owner, attribute, original))
+            setattr(owner, attribute, self.wrap(target, original))
+        return self
+
+    def __exit__(self, *exc):
+        for owner, attribute, original in reversed(self.originals):
+            setattr(owner, attribute, original)
+        self.originals.clear()
+
+    def wrap(self, name: str, func):
+        stats = self.stats[name]
+        if isinstance(func, (staticmethod, classmethod)):
+            return type(func)(self.wrap(name, func.__func__))
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            self.call_stack.append(name)
+            self.child_time.append(0.0)
+            stats.active += 1
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                own = elapsed - self.child_time.pop()
+                stats.active -= 1
+                stats.calls += 1
+                stats.own += own
+                if not stats.active:
+                    stats.total += elapsed
+                self.stacks[";".join(self.call_stack)] += own
+                self.call_stack.pop()
+                if self.child_time:
+                    self.child_time[-1] += elapsed
+        return wrapper
+
+    def flat_profile(self) -> list[dict]:
+        """
+        :return: Calls, total and own time per function, the most expensive own time first
+        """
+        rows = [{"function": name, "calls": s.calls, "total": s.total, "own": s.own} for name, s in self.stats.items()]
+        return sorted(rows, key=lambda r: r["own"], reverse=True)
+
+    def report(self) -> str:
+        lines = [f"{'own (s)':>10} {'total (s)':>10} {'calls':>10}  function"]
+        for r in self.flat_profile():
+            lines.append(f"{r['own']:10.4f} {r['total']:10.4f} {r['calls']:10}  {r['function']}")
+        return "\n".join(lines)
+
+    def collapsed_stacks(self) -> str:
+        """
+        :return: The call stacks in the collapsed format of flamegraph.pl, weighted by own time in microseconds
+        """
+        return "\n".join(f"{stack} {round(seconds * 1e6)}" for stack, seconds in sorted(self.stacks.items()))
+
+
+def resolve(target: str) -> (object, str):
+    """
+    Find the module or class that holds the given function.
+    :param target: Dotted name of a function, starting with its module
+    :return: The owner of the function and the attribute it is stored under
+    """
+    module_name, *path, attribute = target.split('.')
+    owner = importlib.import_module(module_name)
+    for name in path:
+        owner = getattr(owner, name)
+    if attribute not in owner.__dict__:
+        raise AttributeError(f"{target} does not exist")
+    return owner, attribute
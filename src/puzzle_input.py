@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+import os
+from collections.abc import Callable
+
+# --- Puzzle input cache ---
+
+# Inputs are cached next to the solvers as day-N-input.txt, unless AOC_INPUT_DIR points elsewhere
+CACHE_DIR = os.environ.get("AOC_INPUT_DIR", os.path.dirname(os.path.abspath(__file__)))
+YEAR = 2021
+
+Fetcher = Callable[[int], str]
+
+
+def fetch_from_aocd(day: int) -> str:
+    from aocd import get_data
+    return get_data(day=day, year=YEAR)
+
+
+fetcher: Fetcher = fetch_from_aocd
+
+
+def set_fetcher(new_fetcher: Fetcher):
+    """
+    Replace the function used to download inputs that are missing from the cache.
+    :param new_fetcher: A function that takes the day and returns its puzzle input
+    """
+    global fetcher
+    fetcher = new_fetcher
+
+
+def cache_path(day: int) -> str:
+    return os.path.join(CACHE_DIR, f"day-{day}-input.txt")
+
+
+def get_data(day: int, fetch: bool = None) -> str:
+    """
+    Read the puzzle input for the given day from the local cache. Nothing touches the network unless fetching is
+    explicitly allowed, either with fetch=True or by setting AOC_FETCH=1; fetched inputs are written to the cache.
+    :param day: The day of the puzzle
+    :param fetch: Whether to download the input when it isn't cached, defaults to the AOC_FETCH environment variable
+    :return: The puzzle input without surrounding whitespace
+    """
+    path = cache_path(day)
+    if os.path.exists(path):
+        with open(path) as f:
+            return f.read().strip()
+    if fetch is None:
+        fetch = os.environ.get("AOC_FETCH", "0") == "1"
+    if not fetch:
+        raise FileNotFoundError(f"No cached input for day {day} at {path}; set AOC_FETCH=1 to download it")
+    data = fetcher(day).strip()
+    with open(path, "w") as f:
+        f.write(data + "\n")
+    return data
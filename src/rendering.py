@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+import functools
+import os
+
+# --- Rendering switch ---
+
+# Visualisations are off unless AOC_RENDER=1, so batch and benchmark runs never wait on the terminal
+enabled = os.environ.get("AOC_RENDER", "0") == "1"
+
+
+def set_enabled(value: bool):
+    global enabled
+    enabled = value
+
+
+def visual(func):
+    """
+    Decorator for functions that only draw to the terminal: they do nothing while rendering is disabled.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if enabled:
+            return func(*args, **kwargs)
+    return wrapper
+
+
+@visual
+def echo(*args):
+    print(*args)
+
+
+@visual
+def clear():
+    from time import sleep
+    sleep(0.05)
+    os.system('cls' if os.name == 'nt' else 'clear')